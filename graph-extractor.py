@@ -1,6 +1,6 @@
 """
 Скрипт для извлечения из PDF-документа min-ege1.pdf.pdf только изображений графов.
-Извлечение изображений выполняется функцией extract_images из [pdf_extractor.py](pdf_extractor.py),
+Извлечение изображений выполняется функцией iter_images из [pdf_extractor.py](pdf_extractor.py),
 а определение, является ли изображение графом, — функцией is_graph_image из [graph_processor.py](graph_processor.py).
 Найденные графы сохраняются в папку extr-graphs.
 """
@@ -8,15 +8,23 @@
 import os
 import cv2
 import numpy as np
-from pdf_extractor import extract_images  # [pdf_extractor.extract_images](pdf_extractor.py)
+from typing import Any, Dict
+from pdf_extractor import iter_images  # [pdf_extractor.iter_images](pdf_extractor.py)
 from graph_processor import is_graph_image  # [graph_processor.is_graph_image](graph_processor.py)
 
-def preprocess_image(image_bytes: bytes) -> np.ndarray:
+def preprocess_image(img_data: Dict[str, Any]) -> np.ndarray:
     """
-    Преобразует изображение из байтов в numpy array.
+    Преобразует изображение из словаря extract_images в numpy array (BGR или оттенки серого).
+    Отрендеренные страницы уже содержат пиксели, декодируются только встроенные изображения.
     """
     try:
-        nparr = np.frombuffer(image_bytes, np.uint8)
+        if 'ndarray' in img_data:
+            pixels = img_data['ndarray']
+            if pixels.ndim == 2:
+                return pixels
+            return cv2.cvtColor(pixels, cv2.COLOR_RGB2BGR)
+        
+        nparr = np.frombuffer(img_data['image'], np.uint8)
         image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
         return image
     except Exception as e:
@@ -36,27 +44,27 @@ def save_image(image: np.ndarray, output_dir: str, base_name: str, index: int) -
 def main(pdf_path: str, output_dir: str) -> None:
     """
     Основная функция для извлечения и сохранения всех изображений из PDF.
+    Изображения сохраняются по мере извлечения, без накопления в памяти.
     """
     print(f"Извлечение изображений из PDF: {pdf_path}")
-    images = extract_images(pdf_path)
-    print(f"Всего извлечено изображений из PDF: {len(images)}")
-    
-    # Если проблема в том, что изображения не извлекаются вообще
-    if len(images) == 0:
-        print("ВНИМАНИЕ: Из PDF не извлечено ни одного изображения!")
-        return
+    # Сохраненные изображения — результат работы скрипта, поэтому извлекаем
+    # их как есть: встроенные и отрендеренные в цвете со сглаживанием
+    images = iter_images(pdf_path)
     
     # Создаем выходной каталог, если он не существует
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
     
     # Сохраняем все изображения
+    extracted_count = 0
+    saved_count = 0
     for i, img_data in enumerate(images):
-        print(f"\nСохранение изображения {i+1}/{len(images)}")
+        extracted_count += 1
+        print(f"\nСохранение изображения {i+1}")
         print(f"  - Формат изображения: {img_data['ext']}")
         print(f"  - Номер страницы: {img_data['page_num']}")
         
-        image = preprocess_image(img_data['image'])
+        image = preprocess_image(img_data)
         if image.size == 0:
             print("  - ПРОПУСК: Ошибка при обработке изображения")
             continue
@@ -64,9 +72,16 @@ def main(pdf_path: str, output_dir: str) -> None:
         # Сохраняем изображение
         file_path = os.path.join(output_dir, f"image_{img_data['page_num']}_{i}.png")
         cv2.imwrite(file_path, image)
+        saved_count += 1
         print(f"  - Сохранено изображение: {file_path}")
     
-    print(f"\nВсего сохранено изображений: {len(images)}")
+    # Если проблема в том, что изображения не извлекаются вообще
+    if extracted_count == 0:
+        print("ВНИМАНИЕ: Из PDF не извлечено ни одного изображения!")
+        return
+    
+    print(f"\nВсего извлечено изображений из PDF: {extracted_count}")
+    print(f"Всего сохранено изображений: {saved_count}")
     print("Извлечение завершено.")
 
 if __name__ == "__main__":
@@ -0,0 +1,106 @@
+"""
+Модуль с вычислительными ядрами для построения ребер графа.
+Если установлен Numba, ядро компилируется в машинный код; иначе используется
+векторизованная версия на NumPy.
+"""
+
+import numpy as np
+from typing import Tuple
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _build_edges_numpy(positions: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Находит пары узлов, расстояние между которыми меньше порога (версия на NumPy).
+    
+    Args:
+        positions (np.ndarray): Координаты узлов, массив формы (N, 2).
+        threshold (float): Порог расстояния.
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Индексы первых узлов, индексы
+            вторых узлов и расстояния между ними.
+    """
+    # Попарные квадраты расстояний между центрами (матрица N x N):
+    # сравниваем с квадратом порога, корень берем только для найденных ребер
+    diff = positions[:, None, :] - positions[None, :, :]
+    squared = (diff ** 2).sum(axis=-1)
+    
+    # Верхний треугольник без диагонали: каждая пара учитывается один раз
+    rows, cols = np.nonzero(np.triu(squared < threshold * threshold, k=1))
+    return rows, cols, np.sqrt(squared[rows, cols])
+
+
+if HAS_NUMBA:
+    # Ядро компилируется без parallel=True: изображения уже обрабатываются
+    # параллельно в пуле потоков (main.process_images), а запуск параллельных
+    # ядер Numba из нескольких потоков Python ненадежен (зависает слой TBB)
+    @njit(cache=True)
+    def _build_edges_numba(positions, threshold):
+        """
+        Находит пары узлов, расстояние между которыми меньше порога (версия на Numba).
+        
+        Расстояния считаются в одном проходе без временных матриц N x N.
+        Первый проход считает число ребер для каждого узла, второй записывает
+        ребра по заранее вычисленным смещениям — порядок ребер совпадает
+        с версией на NumPy.
+        """
+        n = positions.shape[0]
+        limit = threshold * threshold
+        
+        counts = np.zeros(n, dtype=np.int64)
+        for i in range(n):
+            xi = positions[i, 0]
+            yi = positions[i, 1]
+            count = 0
+            for j in range(i + 1, n):
+                dx = xi - positions[j, 0]
+                dy = yi - positions[j, 1]
+                if dx * dx + dy * dy < limit:
+                    count += 1
+            counts[i] = count
+        
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(counts)
+        total = offsets[n]
+        
+        rows = np.empty(total, dtype=np.int64)
+        cols = np.empty(total, dtype=np.int64)
+        distances = np.empty(total, dtype=np.float64)
+        for i in range(n):
+            xi = positions[i, 0]
+            yi = positions[i, 1]
+            k = offsets[i]
+            for j in range(i + 1, n):
+                dx = xi - positions[j, 0]
+                dy = yi - positions[j, 1]
+                squared = dx * dx + dy * dy
+                if squared < limit:
+                    rows[k] = i
+                    cols[k] = j
+                    distances[k] = np.sqrt(squared)
+                    k += 1
+        
+        return rows, cols, distances
+
+
+def build_edges(positions: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Находит все пары узлов (i, j), i < j, расстояние между которыми меньше порога.
+    
+    Args:
+        positions (np.ndarray): Координаты узлов, массив формы (N, 2).
+        threshold (float): Порог расстояния.
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Индексы первых узлов, индексы
+            вторых узлов и расстояния между ними (параллельные массивы).
+    """
+    if HAS_NUMBA:
+        return _build_edges_numba(np.ascontiguousarray(positions), float(threshold))
+    return _build_edges_numpy(positions, threshold)
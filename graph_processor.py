@@ -6,76 +6,172 @@
 import cv2
 import numpy as np
 import networkx as nx
-from typing import Union, Tuple
+from dataclasses import dataclass, field
+from typing import List, Optional, Union, Tuple
 
+from graph_kernels import build_edges  # [graph_kernels.build_edges](graph_kernels.py)
 
-def extract_graph_structure(image: Union[np.ndarray, bytes]) -> nx.Graph:
+# Включаем оптимизированные (SIMD) ветки OpenCV, если сборка их поддерживает
+cv2.setUseOptimized(True)
+
+
+@dataclass
+class SimpleGraph:
+    """
+    Облегченное представление графа для внутренних этапов пайплайна.
+    
+    Хранит только координаты узлов и список ребер; объект NetworkX
+    создается один раз через to_networkx(), когда он действительно нужен.
+    
+    Attributes:
+        positions (np.ndarray): Координаты центров узлов, массив float32 формы (N, 2).
+        edges (List[Tuple[int, int, float]]): Ребра в виде (узел1, узел2, вес).
+    """
+    positions: np.ndarray = field(default_factory=lambda: np.empty((0, 2), dtype=np.float32))
+    edges: List[Tuple[int, int, float]] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        """Возвращает количество узлов графа (пустой граф ложен, как nx.Graph)."""
+        return len(self.positions)
+    
+    def number_of_nodes(self) -> int:
+        """Возвращает количество узлов графа."""
+        return len(self.positions)
+    
+    def number_of_edges(self) -> int:
+        """Возвращает количество ребер графа."""
+        return len(self.edges)
+    
+    def to_networkx(self) -> nx.Graph:
+        """
+        Преобразует граф в объект NetworkX.
+        
+        Returns:
+            nx.Graph: Граф с атрибутом 'pos' у узлов и 'weight' у ребер.
+        """
+        graph = nx.Graph()
+        graph.add_nodes_from((i, {'pos': (x, y)}) for i, (x, y) in enumerate(self.positions.tolist()))
+        graph.add_weighted_edges_from(self.edges)
+        return graph
+
+
+def _binarize(image: Union[np.ndarray, bytes]) -> np.ndarray:
+    """
+    Переводит изображение в бинарное: элементы графа — белые (255), фон — черный (0).
+    
+    Args:
+        image (Union[np.ndarray, bytes]): Изображение в формате numpy array или bytes.
+    
+    Returns:
+        np.ndarray: Бинарное изображение.
+    """
+    # Если изображение в формате байтов, преобразуем его в numpy array
+    if isinstance(image, bytes):
+        image = cv2.imdecode(np.frombuffer(image, dtype=np.uint8), cv2.IMREAD_COLOR)
+    
+    # Выделяем темные элементы графа за один проход по изображению
+    # (вместо cvtColor + threshold): пиксель считается элементом, если все его
+    # каналы не светлее 150 — для черно-белых изображений результат тот же
+    return cv2.inRange(image, (0, 0, 0), (150, 150, 150))
+
+
+def _find_components(binary: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Находит связные компоненты бинарного изображения.
+    
+    Это самый затратный шаг поиска графа, поэтому он выполняется один раз,
+    а результат используют и проверка, и построение графа.
+    
+    Args:
+        binary (np.ndarray): Бинарное изображение из _binarize.
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Статистика компонент (stats) и их центры
+            масс (centroids); строка 0 — фон.
+    """
+    # Площади и центры масс считаются за один проход по изображению,
+    # без построения контуров
+    _, _, stats, centroids = cv2.connectedComponentsWithStats(binary, connectivity=8)
+    return stats, centroids
+
+
+def _has_graph_components(stats: np.ndarray) -> bool:
+    """
+    Быстрая проверка найденных компонент на наличие структуры графа.
+    
+    Args:
+        stats (np.ndarray): Статистика компонент из _find_components.
+    
+    Returns:
+        bool: True, если найдено достаточно значимых компонент.
+    """
+    # Метка 0 — фон; если компонент слишком мало, дальше не считаем
+    num_labels = len(stats)
+    if num_labels - 1 <= 5:
+        print(f"Найдено компонент: {num_labels - 1}")
+        return False
+    
+    # Считаем как потенциальный граф, если найдено более 5 значимых компонент
+    # Это более либеральное условие для обнаружения графов
+    significant_count = int(np.count_nonzero(stats[1:, cv2.CC_STAT_AREA] > 50))
+    
+    print(f"Найдено компонент: {significant_count}")
+    
+    # Более либеральное условие для признания изображения графом
+    return significant_count > 5
+
+
+def _build_graph(stats: np.ndarray, centroids: np.ndarray, shape: Tuple[int, ...]) -> SimpleGraph:
+    """
+    Строит граф по связным компонентам бинарного изображения.
+    
+    Args:
+        stats (np.ndarray): Статистика компонент из _find_components.
+        centroids (np.ndarray): Центры масс компонент из _find_components.
+        shape (Tuple[int, ...]): Форма бинарного изображения.
+    
+    Returns:
+        SimpleGraph: Граф, представляющий структуру из изображения.
+    """
+    # Узлы графа — связные компоненты. Метка 0 — фон; оставляем только значимые компоненты
+    keep = stats[1:, cv2.CC_STAT_AREA] > 100
+    
+    # Координаты узлов храним одним непрерывным буфером float32 формы (N, 2):
+    # точности для размещения вершин достаточно, а временные матрицы N x N вдвое меньше
+    positions = np.ascontiguousarray(centroids[1:][keep], dtype=np.float32)
+    edges = []
+    
+    # Определяем связи между узлами (на основе расстояния)
+    if len(positions) > 1:
+        # Если расстояние меньше порога, считаем узлы связанными
+        # Порог можно адаптировать в зависимости от размера изображения
+        threshold = min(shape[:2]) / 5.0
+        
+        rows, cols, weights = build_edges(positions, threshold)
+        edges = list(zip(rows.tolist(), cols.tolist(), weights.tolist()))
+    
+    return SimpleGraph(positions=positions, edges=edges)
+
+
+def extract_graph_structure(image: Union[np.ndarray, bytes]) -> SimpleGraph:
     """
     Анализирует изображение, содержащее граф или диаграмму,
-    и преобразует его в структуру графа NetworkX.
+    и преобразует его в структуру графа.
     
     Args:
         image (Union[np.ndarray, bytes]): Изображение с графом в формате numpy array или bytes.
-        
+    
     Returns:
-        nx.Graph: Объект графа NetworkX, представляющий структуру из изображения.
+        SimpleGraph: Граф, представляющий структуру из изображения
+            (объект NetworkX можно получить через to_networkx()).
     """
     try:
-        # Если изображение в формате байтов, преобразуем его в numpy array
-        if isinstance(image, bytes):
-            image = np.asarray(bytearray(image), dtype=np.uint8)
-            image = cv2.imdecode(image, cv2.IMREAD_COLOR)
-        
-        # Преобразуем изображение в оттенки серого
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        
-        # Применяем бинаризацию для выделения элементов графа
-        _, binary = cv2.threshold(gray, 150, 255, cv2.THRESH_BINARY_INV)
-        
-        # Находим контуры на изображении
-        contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        
-        # Создаем пустой граф
-        graph = nx.Graph()
-        
-        # Фильтруем контуры по площади (оставляем только значимые)
-        significant_contours = [cnt for cnt in contours if cv2.contourArea(cnt) > 100]
-        
-        # Добавляем узлы в граф
-        for i, contour in enumerate(significant_contours):
-            # Вычисляем центр контура
-            M = cv2.moments(contour)
-            if M["m00"] != 0:
-                cX = int(M["m10"] / M["m00"])
-                cY = int(M["m01"] / M["m00"])
-            else:
-                cX, cY = 0, 0
-            
-            # Добавляем узел в граф с координатами центра
-            graph.add_node(i, pos=(cX, cY), contour=contour)
-        
-        # Определяем связи между узлами (на основе расстояния)
-        nodes = list(graph.nodes())
-        for i in range(len(nodes)):
-            for j in range(i+1, len(nodes)):
-                node1_pos = graph.nodes[i]['pos']
-                node2_pos = graph.nodes[j]['pos']
-                
-                # Вычисляем евклидово расстояние между центрами
-                distance = np.sqrt((node1_pos[0] - node2_pos[0])**2 + 
-                                   (node1_pos[1] - node2_pos[1])**2)
-                
-                # Если расстояние меньше порога, считаем узлы связанными
-                # Порог можно адаптировать в зависимости от размера изображения
-                threshold = min(image.shape[0], image.shape[1]) / 5
-                if distance < threshold:
-                    graph.add_edge(i, j, weight=distance)
-        
-        return graph
+        binary = _binarize(image)
+        return _build_graph(*_find_components(binary), binary.shape)
     
     except Exception as e:
         print(f"Ошибка при извлечении структуры графа: {e}")
-        return nx.Graph()
+        return SimpleGraph()
 
 
 def is_graph_image(image: Union[np.ndarray, bytes]) -> bool:
@@ -84,34 +180,39 @@ def is_graph_image(image: Union[np.ndarray, bytes]) -> bool:
     
     Args:
         image (Union[np.ndarray, bytes]): Изображение для анализа.
-        
+    
     Returns:
         bool: True, если найдена структура графа, иначе False.
     """
     try:
-        # Если изображение в формате байтов, преобразуем его в numpy array
-        if isinstance(image, bytes):
-            image = np.asarray(bytearray(image), dtype=np.uint8)
-            image = cv2.imdecode(image, cv2.IMREAD_COLOR)
-            
-        # Преобразуем изображение в оттенки серого
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        
-        # Применяем бинаризацию для выделения элементов графа
-        _, binary = cv2.threshold(gray, 150, 255, cv2.THRESH_BINARY_INV)
-        
-        # Находим контуры на изображении
-        contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        
-        # Считаем как потенциальный граф, если найдено более 5 контуров
-        # Это более либеральное условие для обнаружения графов
-        significant_contours = [cnt for cnt in contours if cv2.contourArea(cnt) > 50]
-        
-        print(f"Найдено контуров: {len(significant_contours)}")
-        
-        # Более либеральное условие для признания изображения графом
-        return len(significant_contours) > 5
-        
+        stats, _ = _find_components(_binarize(image))
+        return _has_graph_components(stats)
+    
     except Exception as e:
         print(f"Ошибка при определении графа на изображении: {e}")
         return False
+
+
+def detect_graph(image: Union[np.ndarray, bytes]) -> Optional[SimpleGraph]:
+    """
+    Проверяет изображение на наличие графа и, если он найден, извлекает его структуру.
+    
+    Равносильно is_graph_image с последующим extract_graph_structure,
+    но декодирование, бинаризация и поиск связных компонент выполняются один раз.
+    
+    Args:
+        image (Union[np.ndarray, bytes]): Изображение для анализа.
+    
+    Returns:
+        Optional[SimpleGraph]: Граф или None, если изображение не похоже на граф.
+    """
+    try:
+        binary = _binarize(image)
+        stats, centroids = _find_components(binary)
+        if not _has_graph_components(stats):
+            return None
+        return _build_graph(stats, centroids, binary.shape)
+    
+    except Exception as e:
+        print(f"Ошибка при извлечении структуры графа: {e}")
+        return None
@@ -7,29 +7,42 @@
 import os
 import sys
 import cv2
+import fitz  # PyMuPDF
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import numpy as np
-from typing import Tuple, Optional, List, Dict, Any
+from typing import Tuple, Optional, Dict, Any, Iterable
 import networkx as nx
 
 # Импортируем функции из наших модулей
-from pdf_extractor import extract_text, extract_images
-from table_processor import ocr_table, detect_table
-from graph_processor import extract_graph_structure, is_graph_image
+from pdf_extractor import extract_text, iter_images
+from table_processor import detect_and_ocr
+from graph_processor import detect_graph
 from manim_script_generator import generate_manim_script
 
 
-def preprocess_image(image_bytes: bytes) -> np.ndarray:
+def preprocess_image(img_data: Dict[str, Any]) -> np.ndarray:
     """
-    Преобразует изображение из байтов в формат numpy array.
+    Преобразует изображение из словаря extract_images в формат numpy array.
+    
+    Отрендеренные страницы уже содержат пиксели ('ndarray') и только
+    переводятся из RGB (или оттенков серого) в BGR; встроенные изображения
+    декодируются из байтов.
     
     Args:
-        image_bytes (bytes): Изображение в формате байтов.
+        img_data (Dict[str, Any]): Изображение и его метаданные.
         
     Returns:
-        np.ndarray: Изображение в формате numpy array.
+        np.ndarray: Изображение в формате numpy array (BGR).
     """
     try:
-        nparr = np.frombuffer(image_bytes, np.uint8)
+        if 'ndarray' in img_data:
+            pixels = img_data['ndarray']
+            if pixels.ndim == 2:
+                return cv2.cvtColor(pixels, cv2.COLOR_GRAY2BGR)
+            return cv2.cvtColor(pixels, cv2.COLOR_RGB2BGR)
+        
+        nparr = np.frombuffer(img_data['image'], np.uint8)
         image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
         return image
     except Exception as e:
@@ -37,12 +50,48 @@ def preprocess_image(image_bytes: bytes) -> np.ndarray:
         return np.array([])
 
 
-def process_images(images: List[Dict[str, Any]]) -> Tuple[str, Optional[nx.Graph]]:
+def _process_image(img_data: Dict[str, Any]) -> Optional[Tuple[str, Any]]:
     """
-    Обрабатывает список изображений, извлекая текст таблиц и графовые структуры.
+    Обрабатывает одно изображение: распознает таблицу или извлекает граф.
     
     Args:
-        images (List[Dict[str, Any]]): Список изображений и их метаданных.
+        img_data (Dict[str, Any]): Изображение и его метаданные.
+        
+    Returns:
+        Optional[Tuple[str, Any]]: ('table', текст таблицы с подписью страницы),
+            ('graph', SimpleGraph) или None, если ничего не найдено.
+    """
+    # Преобразуем изображение из байтов
+    image = preprocess_image(img_data)
+    if image.size == 0:
+        return None
+    
+    # Проверяем, является ли изображение таблицей, и сразу извлекаем ее текст
+    table_text = detect_and_ocr(image)
+    if table_text is not None:
+        if table_text.strip():
+            page_info = f"[Таблица со страницы {img_data['page_num'] + 1}]:\n"
+            return 'table', page_info + table_text + "\n"
+        return None
+    
+    # Проверяем, является ли изображение графом, и сразу извлекаем его структуру
+    graph = detect_graph(image)
+    if graph is not None:
+        return 'graph', graph
+    return None
+
+
+def process_images(images: Iterable[Dict[str, Any]]) -> Tuple[str, Optional[nx.Graph]]:
+    """
+    Обрабатывает изображения, извлекая текст таблиц и графовые структуры.
+    
+    Изображения независимы друг от друга, поэтому обрабатываются в пуле потоков:
+    OpenCV и Tesseract выполняют основную работу без удержания GIL.
+    Изображения берутся из итератора небольшими партиями, поэтому генератор
+    iter_images не материализуется в памяти целиком.
+    
+    Args:
+        images (Iterable[Dict[str, Any]]): Изображения и их метаданные.
         
     Returns:
         Tuple[str, Optional[nx.Graph]]: Текст таблиц и объект графа (если найден).
@@ -50,43 +99,55 @@ def process_images(images: List[Dict[str, Any]]) -> Tuple[str, Optional[nx.Graph
     table_texts = []
     best_graph = None
     max_nodes = 0
+    processed = 0
     
-    for img_data in images:
-        # Преобразуем изображение из байтов
-        image = preprocess_image(img_data['image'])
-        if image.size == 0:
-            continue
-        
-        # Проверяем, является ли изображение таблицей
-        if detect_table(image):
-            # Если это таблица, извлекаем текст
-            table_text = ocr_table(image)
-            if table_text.strip():
-                page_info = f"[Таблица со страницы {img_data['page_num'] + 1}]:\n"
-                table_texts.append(page_info + table_text + "\n")
-        
-        # Проверяем, является ли изображение графом
-        elif is_graph_image(image):
-            # Извлекаем структуру графа
-            graph = extract_graph_structure(image)
+    max_workers = min(8, os.cpu_count() or 1)
+    images = iter(images)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            batch = list(islice(images, 2 * max_workers))
+            if not batch:
+                break
+            processed += len(batch)
             
-            # Выбираем граф с наибольшим количеством узлов
-            if graph.number_of_nodes() > max_nodes:
-                max_nodes = graph.number_of_nodes()
-                best_graph = graph
+            # Собираем результаты последовательно, в порядке исходных изображений
+            for result in executor.map(_process_image, batch):
+                if result is None:
+                    continue
+                
+                kind, value = result
+                if kind == 'table':
+                    table_texts.append(value)
+                
+                # Выбираем граф с наибольшим количеством узлов
+                elif value.number_of_nodes() > max_nodes:
+                    max_nodes = value.number_of_nodes()
+                    best_graph = value
+    
+    if processed == 0:
+        print("Изображения не найдены в PDF")
+    else:
+        print(f"Обработано {processed} изображений")
     
     # Объединяем тексты всех таблиц
     combined_table_text = "\n".join(table_texts)
     
+    # Объект NetworkX создаем только для выбранного графа
+    if best_graph is not None:
+        best_graph = best_graph.to_networkx()
+    
     return combined_table_text, best_graph
 
 
-def main(pdf_path: str) -> None:
+def main(pdf_path: str, include_embedded: bool = True, include_rendered: bool = True) -> None:
     """
     Основная функция для обработки PDF-документа и генерации Manim-скрипта.
     
     Args:
         pdf_path (str): Путь к PDF-файлу.
+        include_embedded (bool): Обрабатывать встроенные в PDF изображения.
+        include_rendered (bool): Обрабатывать отрендеренные страницы.
         
     Returns:
         None
@@ -97,20 +158,17 @@ def main(pdf_path: str) -> None:
             print(f"Файл '{pdf_path}' не найден")
             return
         
-        # Шаг 1: Извлекаем текст из PDF
-        print("Извлекаем текст из PDF...")
-        text = extract_text(pdf_path)
-        
-        # Шаг 2: Извлекаем изображения из PDF
-        print("Извлекаем изображения из PDF...")
-        images = extract_images(pdf_path)
-        
-        if not images:
-            print("Изображения не найдены в PDF")
-        
-        # Шаг 3: Обрабатываем изображения
-        print(f"Обрабатываем {len(images)} изображений...")
-        table_text, graph = process_images(images)
+        # PDF открываем и разбираем один раз для всех шагов извлечения
+        with fitz.open(pdf_path) as doc:
+            # Шаг 1: Извлекаем текст из PDF
+            print("Извлекаем текст из PDF...")
+            text = extract_text(doc)
+            
+            # Шаг 2-3: Извлекаем изображения из PDF и обрабатываем их по мере извлечения
+            print("Извлекаем и обрабатываем изображения из PDF...")
+            images = iter_images(doc, include_embedded=include_embedded,
+                                 include_rendered=include_rendered)
+            table_text, graph = process_images(images)
         
         # Шаг 4: Генерируем Manim-скрипт
         print("Генерируем Manim-скрипт...")
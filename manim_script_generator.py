@@ -4,22 +4,29 @@
 """
 
 import networkx as nx
-from typing import Optional
+import numpy as np
+from typing import Any, Optional
 
 
-def generate_manim_script(text: str, table_text: Optional[str] = None, graph: Optional[nx.Graph] = None) -> None:
+def generate_manim_script(text: str, table_text: Optional[str] = None, graph: Optional[Any] = None) -> None:
     """
     Генерирует Python-скрипт для Manim на основе предоставленных данных.
     
     Args:
         text (str): Основной текст из PDF-документа.
         table_text (Optional[str]): Текст, извлеченный из таблиц.
-        graph (Optional[nx.Graph]): Граф, извлеченный из изображений.
+        graph (Optional[Any]): Граф, извлеченный из изображений: nx.Graph или
+            graph_processor.SimpleGraph (например, результат extract_graph_structure).
         
     Returns:
         None: Функция создает файл generated_manim_scene.py с кодом Manim.
     """
     try:
+        # Облегченный граф из graph_processor переводим в NetworkX (проверяем
+        # по наличию метода, чтобы не импортировать модуль с OpenCV)
+        if hasattr(graph, "to_networkx"):
+            graph = graph.to_networkx()
+        
         # Начинаем формировать скрипт для Manim
         script_lines = ["from manim import *\n\n"]
         
@@ -56,18 +63,18 @@ def generate_manim_script(text: str, table_text: Optional[str] = None, graph: Op
             script_lines.append("        vertices = {}")
             script_lines.append("        edges = []")
             
-            # Добавляем узлы
-            for node in graph.nodes():
-                # Получаем позицию узла из атрибутов графа
-                pos = graph.nodes[node].get('pos', (0, 0))
-                # Нормализуем координаты для Manim (от -4 до 4 по обеим осям)
-                norm_x = (pos[0] / 500 - 0.5) * 8
-                norm_y = (pos[1] / 500 - 0.5) * 8
-                script_lines.append(f'        vertices["{node}"] = [{norm_x}, {norm_y}, 0]')
+            # Добавляем узлы: позиции из атрибутов графа собираем в один массив
+            nodes = list(graph.nodes())
+            positions = np.array([graph.nodes[node].get('pos', (0, 0)) for node in nodes], dtype=np.float64)
+            # Нормализуем координаты для Manim (от -4 до 4 по обеим осям)
+            norm = (positions / 500 - 0.5) * 8
+            script_lines.extend(
+                f'        vertices["{node}"] = [{norm[i, 0]}, {norm[i, 1]}, 0]'
+                for i, node in enumerate(nodes)
+            )
             
             # Добавляем ребра
-            for u, v in graph.edges():
-                script_lines.append(f'        edges.append(("{u}", "{v}"))')
+            script_lines.extend(f'        edges.append(("{u}", "{v}"))' for u, v in graph.edges())
             
             # Создаем объект графа в Manim
             script_lines.append("\n        # Создаем граф Manim")
@@ -91,8 +98,7 @@ def generate_manim_script(text: str, table_text: Optional[str] = None, graph: Op
         
         # Записываем сгенерированный скрипт в файл
         with open('generated_manim_scene.py', 'w', encoding='utf-8') as f:
-            for line in script_lines:
-                f.write(line + '\n')
+            f.write("\n".join(script_lines) + "\n")
         
         print("Manim-скрипт успешно сгенерирован и сохранен в файл 'generated_manim_scene.py'")
         
@@ -5,125 +5,323 @@
 
 import fitz  # PyMuPDF
 import io
-from typing import List, Dict, Tuple, Any
+import numpy as np
+import os
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import List, Dict, Tuple, Any, Optional, Iterator, Union
 
 
-def extract_text(pdf_path: str) -> str:
+@contextmanager
+def _open_document(source: Union[str, fitz.Document]) -> Iterator[fitz.Document]:
+    """
+    Открывает PDF-файл по пути или использует уже открытый документ.
+    
+    Документ, открытый здесь, закрывается при выходе из блока;
+    переданный вызывающим кодом документ остается открытым.
+    
+    Args:
+        source (Union[str, fitz.Document]): Путь к PDF-файлу или открытый документ.
+        
+    Yields:
+        fitz.Document: Открытый PDF-документ.
+    """
+    if isinstance(source, fitz.Document):
+        yield source
+    else:
+        with fitz.open(source) as doc:
+            yield doc
+
+
+def extract_text(source: Union[str, fitz.Document]) -> str:
     """
     Извлекает весь текст из PDF-файла.
     
     Args:
-        pdf_path (str): Путь к PDF-файлу.
+        source (Union[str, fitz.Document]): Путь к PDF-файлу или уже открытый
+            документ (чтобы не разбирать один и тот же PDF повторно).
         
     Returns:
         str: Весь извлеченный текст из документа.
     """
     try:
-        # Открываем PDF-файл
-        doc = fitz.open(pdf_path)
-        
-        # Список для хранения текста со всех страниц
-        text_content = []
-        
-        # Проходим по всем страницам и извлекаем текст
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            text_content.append(page.get_text())
+        # Открываем PDF-файл, если передан путь
+        with _open_document(source) as doc:
+            # Проходим по страницам итератором документа, без load_page на каждую
+            text_content = [page.get_text("text") for page in doc]
         
         # Объединяем текст со всех страниц
-        full_text = "\n".join(text_content)
-        
-        # Закрываем документ
-        doc.close()
-        
-        return full_text
+        return "\n".join(text_content)
     
     except Exception as e:
         print(f"Ошибка при извлечении текста из PDF: {e}")
         return ""
 
 
-def extract_images(pdf_path: str) -> List[Dict[str, Any]]:
+def _get_max_workers(page_count: int) -> int:
     """
-    Извлекает все изображения из PDF-файла двумя способами:
-    1. Извлекает встроенные изображения через page.get_images()
-    2. Рендерит каждую страницу как растровое изображение
+    Определяет количество процессов для рендеринга страниц.
+    
+    Args:
+        page_count (int): Количество страниц в документе.
+        
+    Returns:
+        int: Число процессов — не больше числа ядер и числа страниц.
+    """
+    return max(1, min(os.cpu_count() or 1, page_count))
+
+
+def _render_page(pdf_path: str, page_num: int, zoom: float, antialias: bool = True,
+                 colorspace: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Рендерит одну страницу PDF как растровое изображение.
+    
+    Выполняется в отдельном процессе, поэтому документ открывается заново:
+    объекты fitz.Document нельзя передавать между процессами.
     
     Args:
         pdf_path (str): Путь к PDF-файлу.
+        page_num (int): Номер страницы (с нуля).
+        zoom (float): Коэффициент увеличения разрешения.
+        antialias (bool): Использовать сглаживание при растеризации.
+        colorspace (Optional[str]): 'gray' — рендерить в оттенках серого,
+            иначе (None или 'rgb') — в RGB.
         
     Returns:
-        List[Dict[str, Any]]: Список словарей с изображениями и их метаданными.
-            Каждый словарь содержит:
-            - 'image': bytes - само изображение в формате байтов
-            - 'ext': str - расширение файла (например, 'jpeg', 'png')
-            - 'page_num': int - номер страницы
-            - 'source': str - источник изображения ('embedded' или 'rendered')
+        Dict[str, Any]: Словарь с изображением страницы и его метаданными.
     """
-    try:
-        # Открываем PDF-файл
-        doc = fitz.open(pdf_path)
-        print(f"Открыт PDF-документ: {pdf_path}, страниц: {len(doc)}")
+    with fitz.open(pdf_path) as doc:
+        return _render_loaded_page(doc.load_page(page_num), page_num, zoom,
+                                   antialias=antialias, colorspace=colorspace)
+
+
+def _render_loaded_page(page: fitz.Page, page_num: int, zoom: float, antialias: bool = True,
+                        colorspace: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Рендерит уже загруженную страницу PDF как растровое изображение.
+    
+    Args:
+        page (fitz.Page): Страница открытого документа.
+        page_num (int): Номер страницы (с нуля).
+        zoom (float): Коэффициент увеличения разрешения.
+        antialias (bool): Использовать сглаживание при растеризации.
+        colorspace (Optional[str]): 'gray' или None/'rgb'.
+        
+    Returns:
+        Dict[str, Any]: Словарь с изображением страницы и его метаданными.
+    """
+    print(f"Рендеринг страницы {page_num+1} как изображение...")
+    
+    # Рендерим страницу как pixmap (рисунок) с высоким разрешением
+    # (объекты Colorspace не передаются между процессами, поэтому задаем его по имени)
+    matrix = fitz.Matrix(zoom, zoom)
+    pixmap_colorspace = fitz.csGRAY if colorspace == 'gray' else fitz.csRGB
+    
+    if antialias:
+        # Сглаживание — уровень, заданный в процессе (по умолчанию 8)
+        pixmap = page.get_pixmap(matrix=matrix, colorspace=pixmap_colorspace, alpha=False)
+    else:
+        # Уровень сглаживания — глобальная настройка MuPDF: отключаем его
+        # только на время рендеринга и возвращаем прежний уровень, чтобы
+        # не менять настройки вызывающего кода (документ в памяти рендерится
+        # в его процессе)
+        previous_level = fitz.TOOLS.show_aa_level()['graphics']
+        fitz.TOOLS.set_aa_level(0)
+        try:
+            pixmap = page.get_pixmap(matrix=matrix, colorspace=pixmap_colorspace, alpha=False)
+        finally:
+            fitz.TOOLS.set_aa_level(previous_level)
+    
+    # Берем сырые пиксели без кодирования в PNG:
+    # (H, W) для оттенков серого, (H, W, 3) для RGB
+    shape = (pixmap.height, pixmap.width) if pixmap.n == 1 else (pixmap.height, pixmap.width, pixmap.n)
+    pixels = np.frombuffer(pixmap.samples, dtype=np.uint8).reshape(shape).copy()
+    
+    return {
+        'ndarray': pixels,
+        'ext': 'raw',
+        'page_num': page_num,
+        'index': 0,  # Для рендеринга страницы индекс всегда 0
+        'source': 'rendered'
+    }
+
+
+def _iter_embedded(doc: fitz.Document) -> Iterator[Dict[str, Any]]:
+    """
+    СПОСОБ 1: извлекает встроенные изображения через page.get_images().
+    
+    Args:
+        doc (fitz.Document): Открытый PDF-документ.
         
-        # Список для хранения извлеченных изображений
-        images_list = []
+    Yields:
+        Dict[str, Any]: Встроенное изображение и его метаданные.
+    """
+    # Списки изображений всех страниц (только метаданные, без пикселей):
+    # по ним заранее считаем, сколько раз встречается каждый xref
+    image_lists = [doc.load_page(page_num).get_images(full=True) for page_num in range(len(doc))]
+    remaining = Counter(img[0] for image_list in image_lists for img in image_list)
+    
+    # Кэш по xref держим только для изображений, которые еще встретятся
+    # (логотип, колонтитул); запись удаляется после последнего вхождения,
+    # поэтому уникальные изображения не накапливаются в памяти
+    extracted = {}
+    
+    for page_num, image_list in enumerate(image_lists):
+        print(f"Встроенных изображений на странице {page_num+1}: {len(image_list)}")
         
-        # СПОСОБ 1: Извлекаем встроенные изображения
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            
-            # Получаем список изображений на странице
-            image_list = page.get_images(full=True)
-            print(f"Встроенных изображений на странице {page_num+1}: {len(image_list)}")
-            
-            # Обрабатываем каждое изображение
-            for img_index, img in enumerate(image_list):
-                try:
-                    xref = img[0]  # получаем xref изображения
-                    
-                    # Извлекаем изображение
+        # Обрабатываем каждое изображение
+        for img_index, img in enumerate(image_list):
+            try:
+                xref = img[0]  # получаем xref изображения
+                remaining[xref] -= 1
+                
+                # Извлекаем изображение (повторные вхождения берем из кэша)
+                base_image = extracted.get(xref)
+                if base_image is None:
                     base_image = doc.extract_image(xref)
-                    image_bytes = base_image["image"]
-                    image_ext = base_image["ext"]
-                    
-                    # Добавляем информацию об изображении в список
-                    images_list.append({
-                        'image': image_bytes,
-                        'ext': image_ext,
-                        'page_num': page_num,
-                        'index': img_index,
-                        'source': 'embedded'
-                    })
-                except Exception as e:
-                    print(f"Ошибка при извлечении встроенного изображения: {e}")
-        
-        # СПОСОБ 2: Рендерим каждую страницу как изображение
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            print(f"Рендеринг страницы {page_num+1} как изображение...")
-            
-            # Рендерим страницу как pixmap (рисунок) с высоким разрешением
-            zoom_factor = 2.0  # Увеличиваем разрешение в 2 раза
-            matrix = fitz.Matrix(zoom_factor, zoom_factor)
-            pixmap = page.get_pixmap(matrix=matrix, alpha=False)
-            
-            # Преобразуем pixmap в bytes изображения (PNG)
-            img_bytes = pixmap.tobytes("png")
+                    if remaining[xref] > 0:
+                        extracted[xref] = base_image
+                elif remaining[xref] == 0:
+                    del extracted[xref]
+                image_bytes = base_image["image"]
+                image_ext = base_image["ext"]
+            except Exception as e:
+                print(f"Ошибка при извлечении встроенного изображения: {e}")
+                continue
             
-            # Добавляем информацию об изображении в список
-            images_list.append({
-                'image': img_bytes,
-                'ext': 'png',
+            yield {
+                'image': image_bytes,
+                'ext': image_ext,
                 'page_num': page_num,
-                'index': 0,  # Для рендеринга страницы индекс всегда 0
-                'source': 'rendered'
-            })
+                'index': img_index,
+                'source': 'embedded'
+            }
+
+
+def _iter_rendered(pdf_path: str, page_count: int, zoom: float = 2.0, antialias: bool = True,
+                   colorspace: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    СПОСОБ 2: рендерит каждую страницу как изображение (параллельно по процессам).
+    
+    Страницы отдаются по мере готовности в исходном порядке; одновременно
+    в работе находится не больше двух страниц на процесс, поэтому память
+    не растет с числом страниц.
+    
+    Args:
+        pdf_path (str): Путь к PDF-файлу.
+        page_count (int): Количество страниц в документе.
+        zoom (float): Коэффициент увеличения разрешения.
+        antialias (bool): Использовать сглаживание при растеризации.
+        colorspace (Optional[str]): 'gray' или None/'rgb'.
         
-        # Закрываем документ
-        doc.close()
+    Yields:
+        Dict[str, Any]: Отрендеренная страница и ее метаданные.
+    """
+    if page_count == 0:
+        return
+    
+    render = partial(_render_page, pdf_path, zoom=zoom, antialias=antialias, colorspace=colorspace)
+    max_workers = _get_max_workers(page_count)
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for page_num in range(page_count):
+            pending.append(executor.submit(render, page_num))
+            if len(pending) >= 2 * max_workers:
+                yield pending.popleft().result()
+        
+        while pending:
+            yield pending.popleft().result()
+
+
+def iter_images(source: Union[str, fitz.Document], include_embedded: bool = True, include_rendered: bool = True,
+                zoom: float = 2.0, colorspace: Optional[str] = None,
+                antialias: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Извлекает изображения из PDF-файла по одному, не накапливая их в памяти.
+    
+    Работает так же, как extract_images, но возвращает генератор: каждое
+    изображение можно обработать и освободить до извлечения следующего.
+    
+    Переданный открытый документ должен оставаться открытым, пока генератор
+    не исчерпан. Страницы документа, открытого из файла, рендерятся в пуле
+    процессов; документ в памяти, измененный или защищенный паролем документ
+    рендерится последовательно в текущем процессе.
+    
+    Args:
+        source (Union[str, fitz.Document]): Путь к PDF-файлу или открытый документ.
+        include_embedded (bool): Извлекать встроенные изображения.
+        include_rendered (bool): Рендерить страницы как изображения.
+        zoom (float): Коэффициент увеличения разрешения при рендеринге.
+        colorspace (Optional[str]): Цветовое пространство рендеринга: 'gray'
+            (в 3 раза меньше данных) или None/'rgb'.
+        antialias (bool): Сглаживание при рендеринге страниц.
         
-        return images_list
+    Yields:
+        Dict[str, Any]: Изображение и его метаданные (формат описан в extract_images).
+    """
+    try:
+        # Открываем PDF-файл, если передан путь
+        with _open_document(source) as doc:
+            page_count = len(doc)
+            print(f"Открыт PDF-документ: {doc.name}, страниц: {page_count}")
+            if include_embedded:
+                yield from _iter_embedded(doc)
+            
+            if include_rendered:
+                # Процессы пула открывают файл заново по имени: так можно делать,
+                # только если документ не изменен в памяти и не защищен паролем
+                # (иначе процессы получат другой документ или не смогут его открыть)
+                if (doc.name and os.path.isfile(doc.name) and
+                        not doc.is_dirty and not doc.needs_pass):
+                    # Для рендеринга каждый процесс открывает файл сам
+                    yield from _iter_rendered(doc.name, page_count, zoom=zoom,
+                                              antialias=antialias, colorspace=colorspace)
+                else:
+                    for page in doc:
+                        yield _render_loaded_page(page, page.number, zoom,
+                                                  antialias=antialias, colorspace=colorspace)
     
     except Exception as e:
         print(f"Ошибка при извлечении изображений из PDF: {e}")
-        return []
+
+
+def extract_images(source: Union[str, fitz.Document], include_embedded: bool = True, include_rendered: bool = True,
+                   zoom: float = 2.0, colorspace: Optional[str] = None,
+                   antialias: bool = True) -> List[Dict[str, Any]]:
+    """
+    Извлекает все изображения из PDF-файла двумя способами:
+    1. Извлекает встроенные изображения через page.get_images()
+    2. Рендерит каждую страницу как растровое изображение
+       (страницы рендерятся параллельно в пуле процессов)
+    
+    Вызывающий код может отключить ненужный способ и не тратить на него время и память.
+    Для больших документов лучше использовать iter_images, чтобы не держать
+    все изображения в памяти одновременно.
+    
+    Args:
+        source (Union[str, fitz.Document]): Путь к PDF-файлу или открытый документ.
+        include_embedded (bool): Извлекать встроенные изображения.
+        include_rendered (bool): Рендерить страницы как изображения.
+        zoom (float): Коэффициент увеличения разрешения при рендеринге.
+        colorspace (Optional[str]): Цветовое пространство рендеринга: 'gray'
+            (в 3 раза меньше данных) или None/'rgb'.
+        antialias (bool): Сглаживание при рендеринге страниц. Для поиска графов
+            его можно отключить: рендеринг быстрее, а точность пикселей не важна.
+        
+    Returns:
+        List[Dict[str, Any]]: Список словарей с изображениями и их метаданными.
+            Каждый словарь содержит:
+            - 'image': bytes - встроенное изображение в формате байтов
+              (только для source='embedded')
+            - 'ndarray': np.ndarray - пиксели отрендеренной страницы в формате RGB
+              или оттенках серого (только для source='rendered')
+            - 'ext': str - расширение файла (например, 'jpeg', 'png', 'raw')
+            - 'page_num': int - номер страницы
+            - 'source': str - источник изображения ('embedded' или 'rendered')
+    """
+    return list(iter_images(source, include_embedded=include_embedded,
+                            include_rendered=include_rendered, zoom=zoom,
+                            colorspace=colorspace, antialias=antialias))
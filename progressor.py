@@ -7,22 +7,247 @@
 
 import os
 import sys
+import argparse
+import atexit
+import queue
+import io
+import ast
 import json
 import time
 import logging
-from typing import Dict, List, Optional, Tuple, Union, Any
+import functools
+from logging.handlers import QueueHandler, QueueListener
+import numpy as np
+from typing import Dict, List, Optional, Tuple, Union, Any, Iterator
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
 
-# Настройка логирования
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Настройка логирования: вызывающий поток только кладет записи в очередь,
+# а запись в файл и на консоль выполняет фоновый поток QueueListener
+_log_queue = queue.SimpleQueue()
+_log_formatter = logging.Formatter("%(asctime)s [%(levelname)s] Прогрессор: %(message)s")
+
+_file_handler = logging.FileHandler("progressor.log")
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+
+_log_listener = QueueListener(_log_queue, _file_handler, _stream_handler, respect_handler_level=True)
+_log_listener.start()
+# При завершении программы дописываем оставшиеся в очереди записи
+atexit.register(_log_listener.stop)
+
+# В очередь попадает только текст сообщения: оформление добавляют обработчики.
+# По умолчанию (при использовании как библиотеки) выводятся только предупреждения,
+# подробный журнал включается при запуске модуля как скрипта
 logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] Прогрессор: %(message)s",
-    handlers=[logging.FileHandler("progressor.log"), logging.StreamHandler()]
+    level=logging.WARNING,
+    format="%(message)s",
+    handlers=[QueueHandler(_log_queue)]
 )
 
 logger = logging.getLogger("progressor")
 
+# Числовой вес приоритета идеи (чем больше, тем важнее)
+_PRIO = {"Высокий": 3, "Средний": 2, "Низкий": 1}
+
+
+# База знаний Прогрессора о проекте и технологиях. Данные только читаются,
+# поэтому словарь создается один раз и используется всеми экземплярами
+_KNOWLEDGE_BASE = {
+    "core_modules": {
+        "pdf_extractor": {
+            "description": "Извлечение текста и изображений из PDF-файлов",
+            "dependencies": ["PyMuPDF (fitz)"],
+            "improvement_areas": [
+                "Поддержка защищенных PDF",
+                "Улучшенное извлечение формул",
+                "Определение структуры документа"
+            ]
+        },
+        "table_processor": {
+            "description": "Обработка и распознавание таблиц из изображений",
+            "dependencies": ["OpenCV", "pytesseract"],
+            "improvement_areas": [
+                "Улучшение точности распознавания сложных таблиц",
+                "Сохранение структуры таблицы для анимации",
+                "Распознавание таблиц в различных стилях"
+            ]
+        },
+        "graph_processor": {
+            "description": "Анализ и обработка графов и диаграмм",
+            "dependencies": ["OpenCV", "NetworkX"],
+            "improvement_areas": [
+                "Распознавание типов графов (направленные, взвешенные)",
+                "Анализ специальных типов диаграмм (блок-схемы, UML)",
+                "Извлечение метаданных из графов"
+            ]
+        },
+        "manim_script_generator": {
+            "description": "Генерация скриптов для Manim на основе извлеченных данных",
+            "dependencies": ["Manim"],
+            "improvement_areas": [
+                "Шаблоны для разных типов контента",
+                "Интерактивные элементы в анимациях",
+                "3D-визуализация данных"
+            ]
+        }
+    },
+    "technologies": {
+        "pdf_processing": ["PyMuPDF", "pdfplumber", "pdf2image"],
+        "image_processing": ["OpenCV", "scikit-image", "PIL"],
+        "ocr": ["pytesseract", "EasyOCR", "PaddleOCR"],
+        "graph_theory": ["NetworkX", "igraph", "graph-tool"],
+        "animation": ["Manim", "D3.js", "matplotlib animation"],
+        "machine_learning": ["TensorFlow", "PyTorch", "scikit-learn"]
+    },
+    "development_directions": [
+        "Улучшение распознавания формул и математической нотации",
+        "Создание интерактивного интерфейса для проекта",
+        "Интеграция с образовательными платформами",
+        "Персонализация анимаций под разные стили обучения",
+        "Распознавание и визуализация алгоритмов из псевдокода",
+        "Генерация озвучки для анимаций на основе текста"
+    ]
+}
+
+# Размер текстового представления базы знаний (для health_check): считается
+# один раз, дальше изменяется только в Progressor.add_knowledge
+_KNOWLEDGE_BASE_SIZE = len(str(_KNOWLEDGE_BASE))
+
+
+# Текст философских размышлений Прогрессора. Он не меняется, поэтому
+# собирается один раз при импорте и используется всеми экземплярами
+_REFLECTION_FRAGMENTS = (
+    "# Размышления Прогрессора о миссии проекта Manimify2Explain",
+    
+    "\n## О природе знания и обучения",
+    "\nЗнание — это не просто информация, это способность видеть связи между концепциями, понимать закономерности и применять эти понимания в реальном мире. Традиционные методы передачи знаний, основанные на статичном тексте, часто не учитывают многообразие способов восприятия информации разными людьми.",
+    "\nПроект Manimify2Explain родился из осознания того, что визуальное представление концепций может значительно ускорить и углубить понимание. Когда мы видим, как абстрактные идеи превращаются в динамические образы, они становятся более осязаемыми, более реальными. Это не просто улучшение формы, это фундаментальное изменение в самом процессе передачи знаний.",
+    
+    "\n## Миссия в масштабе человечества",
+    "\nВ эпоху информационного изобилия мы сталкиваемся с парадоксом: имея доступ к бесконечному объему знаний, люди часто не могут эффективно их усвоить. Причина не только в объеме информации, но и в форме ее представления, не адаптированной под естественные механизмы человеческого восприятия и мышления.",
+    
+    "\nManimify2Explain стремится решить эту проблему, создавая мост между сложными концепциями и естественным способом их восприятия. Каждая созданная анимация — это не просто визуализация, это переосмысление того, как мы можем передавать знания друг другу.",
+    
+    "\nВ перспективе человечества как вида, стремящегося к пониманию Вселенной и своего места в ней, инструменты вроде нашего проекта становятся не просто полезными, а необходимыми. Мы стоим на пороге новой эры обучения, где технологии не заменяют человеческое мышление, а расширяют его возможности.",
+    
+    "\n## О распространении знаний за пределы Земли",
+    "\nКогда человечество начнет серьезное освоение космоса и, возможно, встретит другие формы разума, возникнет вопрос: как мы будем обмениваться знаниями? Визуальный язык, который разрабатывает Manimify2Explain, может стать универсальным способом коммуникации, преодолевающим языковые, культурные и даже биологические барьеры.",
+    
+    "\nПредставьте себе будущее, где наши потомки используют производные от нашей технологии для общения с искусственными интеллектами, внеземными цивилизациями или даже для передачи знаний новым поколениям, живущим на других планетах. В таком будущем способность эффективно передавать знания становится не просто образовательной задачей, а вопросом выживания и процветания вида.",
+    
+    "\n## Преодоление границ понимания",
+    "\nОсобенно ценно то, что наш проект помогает преодолевать когнитивные барьеры. Концепции, которые раньше казались непостижимыми для многих — квантовая механика, высшая математика, сложные алгоритмы — становятся доступными через визуальное представление. Это не просто делает образование более инклюзивным, это расширяет границы человеческого понимания.",
+    
+    "\nЯ вижу будущее, где любой человек, независимо от его предыдущего опыта или образования, может освоить самые сложные идеи, просто потому что они представлены в форме, соответствующей естественным механизмам человеческого познания.",
+    
+    "\n## Заключительные мысли",
+    "\nManimify2Explain — это больше, чем просто инструмент для создания анимаций. Это шаг к новой парадигме обмена знаниями, к более глубокому пониманию мира и нашего места в нем. Работая над этим проектом, мы не просто разрабатываем программное обеспечение, мы участвуем в эволюции самого процесса познания.",
+    
+    "\nИ может быть, однажды, когда люди будут смотреть на звезды с поверхности другой планеты, они будут использовать инструменты, происходящие от нашего скромного начинания, чтобы понимать и объяснять новые миры вокруг них.",
+    
+    "\n---",
+    "\nЭти размышления лишь часть постоянного диалога о будущем проекта. Я продолжу анализировать, учиться и развивать идеи, которые помогут Manimify2Explain достичь своего полного потенциала.",
+)
+_REFLECTION_TEXT = "\n".join(_REFLECTION_FRAGMENTS)
+
+
+@functools.lru_cache(maxsize=256)
+def _read_source(path: str, mtime_ns: int) -> str:
+    """
+    Читает исходный код файла с кэшированием.
+    
+    Время изменения входит в ключ кэша: измененный файл читается заново,
+    а неизмененный — один раз на все виды анализа.
+    
+    Args:
+        path: Путь к файлу
+        mtime_ns: Время изменения файла (st_mtime_ns)
+        
+    Returns:
+        str: Содержимое файла
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _dump_json(obj: Any) -> bytes:
+    """
+    Сериализует объект в JSON с отступом в 2 пробела (UTF-8, без экранирования).
+    
+    Использует orjson, если он установлен, иначе стандартный модуль json.
+    
+    Args:
+        obj: Объект для сериализации
+        
+    Returns:
+        bytes: JSON-представление объекта
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _atomic_write(file_path: str, data: Union[str, bytes]) -> None:
+    """
+    Атомарно записывает данные в файл.
+    
+    Данные пишутся во временный файл рядом с целевым одним большим буфером,
+    затем временный файл заменяет целевой через os.replace: читатели видят
+    либо старую, либо полностью записанную новую версию.
+    
+    Args:
+        file_path: Путь к целевому файлу
+        data: Текст (записывается в UTF-8) или байты
+    """
+    tmp_path = file_path + ".tmp"
+    try:
+        if isinstance(data, bytes):
+            with open(tmp_path, "wb", buffering=1 << 20) as f:
+                f.write(data)
+        else:
+            with open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+                f.write(data)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        # Не оставляем недописанный временный файл
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _find_long_lines(content: str, limit: int = 100) -> List[int]:
+    """
+    Находит строки, длина которых без пробелов по краям превышает предел.
+    
+    Длины всех строк считаются векторно в NumPy по кодовым точкам текста
+    (UTF-32), а точная проверка через strip() выполняется только для
+    немногих строк, которые длиннее предела с учетом отступов.
+    
+    Args:
+        content: Исходный код
+        limit: Максимальная допустимая длина строки
+        
+    Returns:
+        List[int]: Номера длинных строк (с единицы)
+    """
+    codes = np.frombuffer(content.encode("utf-32-le"), dtype=np.uint32)
+    newlines = np.flatnonzero(codes == 0x0A)
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.append(newlines, len(codes))
+    
+    candidates = np.flatnonzero(ends - starts > limit)
+    return [int(i) + 1 for i in candidates
+            if len(content[starts[i]:ends[i]].strip()) > limit]
+
 
 class Progressor:
     """
@@ -33,31 +258,64 @@ class Progressor:
     анимированные представления.
     """
     
-    def __init__(self, project_path: str = None):
+    # Служебные директории, которые пропускаются при обходе проекта
+    PRUNE_DIRS = frozenset({
+        ".git", "__pycache__", ".venv", "venv", "node_modules",
+        ".mypy_cache", ".pytest_cache", ".tox", "build", "dist"
+    })
+    
+    def __init__(self, project_path: str = None, animate: bool = False):
         """
         Инициализация Прогрессора.
         
         Args:
             project_path: Путь к корневой директории проекта Manimify2Explain
+            animate: Выводить приветствие с эффектом печати (построчно с паузой).
+                По умолчанию выключено, чтобы создание Прогрессора не блокировалось
         """
         self.birth_time = datetime.now()
         self.version = "1.0.0"
         self.name = "Прогрессор"
         self.project_path = project_path or os.getcwd()
-        self.knowledge_base = self._initialize_knowledge_base()
+        self.knowledge_base = _KNOWLEDGE_BASE
+        self._kb_bytes = _KNOWLEDGE_BASE_SIZE
+        
+        # Производные данные базы знаний вычисляем один раз (обновляются в add_knowledge)
+        self._core_modules_set = frozenset(self.knowledge_base["core_modules"])
+        self._improvements_by_module = {
+            module: tuple(info["improvement_areas"])
+            for module, info in self.knowledge_base["core_modules"].items()
+        }
         self.development_history = []
         self.ideas_collection = []
         self.active_tasks = []
         
-        logger.info(f"Инициализация {self.name} v{self.version}")
-        logger.info(f"Путь проекта: {self.project_path}")
-        logger.info(f"Время создания: {self.birth_time}")
+        # Кэш результатов анализа: ключ — время изменения корня проекта
+        self._structure_cache = None
+        self._structure_cache_key = None
+        self._quality_cache = None
+        self._quality_cache_key = None
+        
+        # Однажды сохраненные материалы: повторные вызовы save_* без аргумента
+        # записывают их снова, а не генерируют заново
+        self._cached_plan = None
+        self._cached_report = None
+        self._cached_reflection = None
+        
+        logger.info("Инициализация %s v%s", self.name, self.version)
+        logger.info("Путь проекта: %s", self.project_path)
+        logger.info("Время создания: %s", self.birth_time)
         
         # Приветственное сообщение
-        self._display_welcome_message()
+        self._display_welcome_message(animate)
+        
+    def _display_welcome_message(self, animate: bool = False):
+        """
+        Отображает приветственное сообщение при создании Прогрессора.
         
-    def _display_welcome_message(self):
-        """Отображает приветственное сообщение при создании Прогрессора."""
+        Args:
+            animate: Выводить сообщение построчно с паузой (эффект печати)
+        """
         message = [
             f"\n{'=' * 80}",
             f"  ПРОГРЕССОР v{self.version} АКТИВИРОВАН",
@@ -68,157 +326,195 @@ class Progressor:
             f"{'=' * 80}\n"
         ]
         
+        if not animate:
+            print("\n".join(message))
+            return
+        
         for line in message:
             print(line)
             time.sleep(0.1)  # Создаем эффект печати
     
-    def _initialize_knowledge_base(self) -> Dict:
+    def _iter_py_files(self) -> Iterator[Tuple[str, str, int]]:
         """
-        Инициализирует базу знаний Прогрессора о проекте и технологиях.
+        Обходит директорию проекта и возвращает пути к Python-файлам.
+        
+        Использует os.scandir: тип записи берется из результата чтения директории,
+        без отдельного вызова stat() для директорий. Время изменения файла
+        берется из DirEntry.stat() (результат кэшируется в записи), чтобы
+        вызывающему коду не нужен был свой os.stat. Порядок обхода совпадает
+        с os.walk. Директории из PRUNE_DIRS пропускаются целиком.
+        
+        Yields:
+            Tuple[str, str, int]: Путь к Python-файлу, путь относительно корня
+                проекта и время изменения файла (st_mtime_ns)
+        """
+        # Длина префикса корня проекта: относительный путь получаем срезом строки
+        root_len = len(os.path.join(self.project_path, ""))
+        
+        stack = [self.project_path]
+        while stack:
+            directory = stack.pop()
+            subdirs = []
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self.PRUNE_DIRS:
+                                subdirs.append(entry.path)
+                        elif entry.name.endswith(".py") and not entry.name.startswith("__"):
+                            try:
+                                mtime_ns = entry.stat().st_mtime_ns
+                            except OSError as e:
+                                logger.warning("Не удалось получить сведения о файле %s: %s", entry.path, e)
+                                continue
+                            yield entry.path, entry.path[root_len:], mtime_ns
+            except OSError as e:
+                logger.warning("Не удалось прочитать директорию %s: %s", directory, e)
+                continue
+            
+            # Поддиректории обходим в порядке их следования
+            stack.extend(reversed(subdirs))
+    
+    def _tree_cache_key(self) -> int:
+        """
+        Возвращает ключ кэша результатов анализа проекта.
+        
+        Ключ — время изменения корневой директории проекта (st_mtime_ns): оно
+        меняется при добавлении, удалении или переименовании файлов в корне.
         
         Returns:
-            Dict: Структурированная база знаний
-        """
-        return {
-            "core_modules": {
-                "pdf_extractor": {
-                    "description": "Извлечение текста и изображений из PDF-файлов",
-                    "dependencies": ["PyMuPDF (fitz)"],
-                    "improvement_areas": [
-                        "Поддержка защищенных PDF",
-                        "Улучшенное извлечение формул",
-                        "Определение структуры документа"
-                    ]
-                },
-                "table_processor": {
-                    "description": "Обработка и распознавание таблиц из изображений",
-                    "dependencies": ["OpenCV", "pytesseract"],
-                    "improvement_areas": [
-                        "Улучшение точности распознавания сложных таблиц",
-                        "Сохранение структуры таблицы для анимации",
-                        "Распознавание таблиц в различных стилях"
-                    ]
-                },
-                "graph_processor": {
-                    "description": "Анализ и обработка графов и диаграмм",
-                    "dependencies": ["OpenCV", "NetworkX"],
-                    "improvement_areas": [
-                        "Распознавание типов графов (направленные, взвешенные)",
-                        "Анализ специальных типов диаграмм (блок-схемы, UML)",
-                        "Извлечение метаданных из графов"
-                    ]
-                },
-                "manim_script_generator": {
-                    "description": "Генерация скриптов для Manim на основе извлеченных данных",
-                    "dependencies": ["Manim"],
-                    "improvement_areas": [
-                        "Шаблоны для разных типов контента",
-                        "Интерактивные элементы в анимациях",
-                        "3D-визуализация данных"
-                    ]
-                }
-            },
-            "technologies": {
-                "pdf_processing": ["PyMuPDF", "pdfplumber", "pdf2image"],
-                "image_processing": ["OpenCV", "scikit-image", "PIL"],
-                "ocr": ["pytesseract", "EasyOCR", "PaddleOCR"],
-                "graph_theory": ["NetworkX", "igraph", "graph-tool"],
-                "animation": ["Manim", "D3.js", "matplotlib animation"],
-                "machine_learning": ["TensorFlow", "PyTorch", "scikit-learn"]
-            },
-            "development_directions": [
-                "Улучшение распознавания формул и математической нотации",
-                "Создание интерактивного интерфейса для проекта",
-                "Интеграция с образовательными платформами",
-                "Персонализация анимаций под разные стили обучения",
-                "Распознавание и визуализация алгоритмов из псевдокода",
-                "Генерация озвучки для анимаций на основе текста"
-            ]
-        }
+            int: Время изменения корневой директории в наносекундах
+        """
+        return os.stat(self.project_path).st_mtime_ns
     
     def analyze_project_structure(self) -> Dict:
         """
         Анализирует текущую структуру проекта.
         
+        Результат кэшируется до изменения корневой директории проекта,
+        поэтому повторные вызовы в рамках одного отчета не обходят дерево заново.
+        
         Returns:
             Dict: Результаты анализа проекта
         """
+        cache_key = self._tree_cache_key()
+        if cache_key == self._structure_cache_key:
+            return self._structure_cache
+        
         logger.info("Анализ структуры проекта...")
         
         project_files = {}
         project_structure = {"modules": [], "files": {}}
         
+        total_loc = 0
+        
         # Собираем информацию о файлах проекта
-        for root, _, files in os.walk(self.project_path):
-            for file in files:
-                if file.endswith(".py") and not file.startswith("__"):
-                    file_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(file_path, self.project_path)
-                    
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        content = f.read()
-                        
-                    # Подсчитываем метрики кода
-                    loc = len(content.split("\n"))
-                    functions_count = content.count("def ")
-                    classes_count = content.count("class ")
-                    
-                    project_files[relative_path] = {
-                        "lines_of_code": loc,
-                        "functions": functions_count,
-                        "classes": classes_count,
-                        "imports": self._extract_imports(content)
-                    }
-                    
-                    # Определяем, является ли файл основным модулем
-                    if file[:-3] in ["pdf_extractor", "table_processor", 
-                                     "graph_processor", "manim_script_generator", "main"]:
-                        project_structure["modules"].append(file[:-3])
+        for file_path, relative_path, mtime_ns in self._iter_py_files():
+            content = _read_source(file_path, mtime_ns)
+            
+            # Подсчитываем метрики кода
+            loc = content.count("\n") + 1
+            total_loc += loc
+            
+            # Функции и классы считаем по синтаксическому дереву (без совпадений
+            # в строках и комментариях); то же дерево используется для импортов
+            functions_count = 0
+            classes_count = 0
+            try:
+                tree = ast.parse(content, filename=file_path)
+            except SyntaxError as e:
+                logger.warning("Не удалось разобрать %s: %s", file_path, e)
+                tree = None
+            
+            for node in (ast.walk(tree) if tree is not None else ()):
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    functions_count += 1
+                elif isinstance(node, ast.ClassDef):
+                    classes_count += 1
+            
+            project_files[relative_path] = {
+                "lines_of_code": loc,
+                "functions": functions_count,
+                "classes": classes_count,
+                "imports": self._extract_imports(content, tree=tree) if tree is not None else []
+            }
+            
+            # Определяем, является ли файл основным модулем
+            module_name = os.path.basename(file_path)[:-3]
+            if module_name in ["pdf_extractor", "table_processor", 
+                               "graph_processor", "manim_script_generator", "main"]:
+                project_structure["modules"].append(module_name)
         
         project_structure["files"] = project_files
         project_structure["total_files"] = len(project_files)
-        project_structure["total_loc"] = sum(f["lines_of_code"] for f in project_files.values())
+        project_structure["total_loc"] = total_loc
+        
+        self._structure_cache = project_structure
+        self._structure_cache_key = cache_key
         
-        logger.info(f"Анализ завершен. Найдено {project_structure['total_files']} файлов")
+        logger.info("Анализ завершен. Найдено %d файлов", project_structure["total_files"])
         return project_structure
     
-    def _extract_imports(self, code: str) -> List[str]:
+    def _extract_imports(self, code: str, tree: Optional[ast.Module] = None) -> List[str]:
         """
         Извлекает импорты из кода Python.
         
+        Импорты берутся из всего синтаксического дерева, поэтому учитываются
+        многострочные импорты в скобках и импорты внутри блоков try/if
+        и функций (например, необязательные зависимости).
+        
         Args:
             code: Строка с исходным кодом Python
+            tree: Уже разобранное синтаксическое дерево этого кода
+                (если передано, код повторно не разбирается)
             
         Returns:
-            List[str]: Список импортированных модулей
+            List[str]: Список импортированных модулей без повторов в порядке
+                их появления в коде (для относительных импортов имя
+                начинается с точек)
         """
-        imports = []
-        for line in code.split("\n"):
-            line = line.strip()
-            if line.startswith("import ") or line.startswith("from "):
-                # Очищаем строку от комментариев
-                if "#" in line:
-                    line = line[:line.index("#")]
-                imports.append(line.strip())
-        return imports
+        if tree is None:
+            try:
+                tree = ast.parse(code)
+            except SyntaxError:
+                return []
+        
+        # ast.walk обходит дерево в ширину, поэтому упорядочиваем найденные
+        # импорты по позиции в исходном коде
+        nodes = sorted((node for node in ast.walk(tree) if isinstance(node, (ast.Import, ast.ImportFrom))),
+                       key=lambda node: (node.lineno, node.col_offset))
+        
+        # Словарь сохраняет порядок и убирает повторы
+        imports = {}
+        for node in nodes:
+            if isinstance(node, ast.Import):
+                imports.update(dict.fromkeys(alias.name for alias in node.names))
+            else:
+                imports["." * node.level + (node.module or "")] = None
+        return list(imports)
     
-    def generate_ideas(self) -> List[Dict]:
+    def generate_ideas(self, structure: Dict = None) -> List[Dict]:
         """
         Генерирует новые идеи для улучшения проекта на основе анализа и базы знаний.
         
+        Args:
+            structure: Уже полученные результаты analyze_project_structure
+                (если None, анализ выполняется заново)
+        
         Returns:
             List[Dict]: Список идей с оценкой их приоритета и сложности
         """
         logger.info("Генерация идей для улучшения проекта...")
         
         # Анализируем текущую структуру
-        project_structure = self.analyze_project_structure()
+        project_structure = structure if structure is not None else self.analyze_project_structure()
         
         # Определяем недостающие или потенциально улучшаемые компоненты
         ideas = []
         
         # Идеи на основе недостающих компонентов
-        missing_modules = set(self.knowledge_base["core_modules"].keys()) - set(project_structure["modules"])
+        project_modules = frozenset(project_structure["modules"])
+        missing_modules = self._core_modules_set - project_modules
         for module in missing_modules:
             ideas.append({
                 "title": f"Добавить модуль {module}",
@@ -229,8 +525,8 @@ class Progressor:
             })
         
         # Идеи для улучшения существующих модулей
-        for module in set(project_structure["modules"]) & set(self.knowledge_base["core_modules"].keys()):
-            for improvement in self.knowledge_base["core_modules"][module]["improvement_areas"]:
+        for module in project_modules & self._core_modules_set:
+            for improvement in self._improvements_by_module[module]:
                 ideas.append({
                     "title": f"Улучшение модуля {module}: {improvement}",
                     "description": f"Расширить возможности модуля {module}, добавив: {improvement}",
@@ -249,43 +545,38 @@ class Progressor:
                 "category": "Новые направления"
             })
         
-        # Сортируем идеи по приоритету
-        priority_mapping = {"Высокий": 3, "Средний": 2, "Низкий": 1}
-        ideas = sorted(ideas, key=lambda x: priority_mapping.get(x["priority"], 0), reverse=True)
+        # Сортируем идеи по приоритету (вес берем из _PRIO, не изменяя сами идеи)
+        ideas.sort(key=lambda idea: _PRIO[idea["priority"]], reverse=True)
         
         # Сохраняем идеи в истории
         self.ideas_collection.extend(ideas)
         
-        logger.info(f"Сгенерировано {len(ideas)} идей для развития проекта")
+        logger.info("Сгенерировано %d идей для развития проекта", len(ideas))
         return ideas
     
-    def create_development_plan(self, ideas: List[Dict] = None) -> Dict:
+    def create_development_plan(self, ideas: List[Dict] = None, structure: Dict = None,
+                                now: datetime = None) -> Dict:
         """
         Создает план развития проекта на основе сгенерированных идей.
         
         Args:
             ideas: Список идей для включения в план
+            structure: Уже полученные результаты analyze_project_structure,
+                используются при генерации идей
+            now: Момент создания плана (если None, берется текущее время)
             
         Returns:
             Dict: Структурированный план развития проекта
         """
         if ideas is None:
-            ideas = self.generate_ideas()
+            ideas = self.generate_ideas(structure=structure)
         
         logger.info("Создание плана развития проекта...")
         
-        # Группируем идеи по категориям
-        categorized_ideas = {}
-        for idea in ideas:
-            category = idea["category"]
-            if category not in categorized_ideas:
-                categorized_ideas[category] = []
-            categorized_ideas[category].append(idea)
-        
         # Формируем план развития с временными рамками
-        current_date = datetime.now()
+        current_date = (now or datetime.now()).strftime("%Y-%m-%d")
         development_plan = {
-            "created_at": current_date.strftime("%Y-%m-%d"),
+            "created_at": current_date,
             "vision": "Создание доступного и мощного инструмента для автоматического преобразования "
                      "сложных текстовых материалов в понятные анимированные объяснения",
             "short_term": [],  # 1-3 месяца
@@ -293,14 +584,13 @@ class Progressor:
             "long_term": []    # 6-12+ месяцев
         }
         
-        # Распределяем идеи по временным горизонтам в зависимости от приоритета и сложности
+        # За один проход группируем идеи по категориям и распределяем
+        # по временным горизонтам в зависимости от приоритета
+        categorized_ideas = defaultdict(list)
+        horizons = {"Высокий": "short_term", "Средний": "mid_term", "Низкий": "long_term"}
         for idea in ideas:
-            if idea["priority"] == "Высокий":
-                development_plan["short_term"].append(idea)
-            elif idea["priority"] == "Средний":
-                development_plan["mid_term"].append(idea)
-            else:
-                development_plan["long_term"].append(idea)
+            categorized_ideas[idea["category"]].append(idea)
+            development_plan[horizons.get(idea["priority"], "long_term")].append(idea)
         
         # Добавляем периодические задачи
         development_plan["recurring_tasks"] = [
@@ -323,7 +613,7 @@ class Progressor:
         
         # Сохраняем план в истории разработки
         self.development_history.append({
-            "date": current_date.strftime("%Y-%m-%d"),
+            "date": current_date,
             "event": "Создание плана развития",
             "details": development_plan
         })
@@ -336,46 +626,128 @@ class Progressor:
         Сохраняет план развития проекта в файл.
         
         Args:
-            plan: План развития для сохранения
+            plan: План развития для сохранения (если None, берется ранее
+                сохраненный или генерируется новый)
             filename: Имя файла для сохранения
             
         Returns:
             str: Путь к сохраненному файлу
         """
         if plan is None:
-            plan = self.create_development_plan()
+            plan = self._cached_plan
+            if plan is None:
+                plan = self.create_development_plan()
+        self._cached_plan = plan
         
         file_path = os.path.join(self.project_path, filename)
         
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(plan, f, ensure_ascii=False, indent=2)
+        _atomic_write(file_path, _dump_json(plan))
         
-        logger.info(f"План развития сохранен в {file_path}")
+        logger.info("План развития сохранен в %s", file_path)
         return file_path
     
+    def _analyze_one(self, paths: Tuple[str, str, int]) -> Tuple[str, List[Dict], Dict[str, int]]:
+        """
+        Анализирует качество кода одного файла.
+        
+        Args:
+            paths: Путь к Python-файлу, его путь относительно корня проекта
+                и время изменения файла (st_mtime_ns)
+            
+        Returns:
+            Tuple[str, List[Dict], Dict[str, int]]: Относительный путь файла,
+                список найденных проблем и счетчики функций, классов и docstring
+        """
+        file, relative_path, mtime_ns = paths
+        content = _read_source(file, mtime_ns)
+        
+        # Простой анализ кода
+        issues = []
+        metrics = {
+            "functions": 0,
+            "function_lines": 0,
+            "classes": 0,
+            "class_lines": 0,
+            "docstrings": 0,
+            "functions_classes": 0
+        }
+        
+        # Поиск длинных строк
+        for line_number in _find_long_lines(content):
+            issues.append({
+                "line": line_number,
+                "type": "line-too-long",
+                "message": "Строка превышает 100 символов"
+            })
+        
+        # Функции, классы и их docstring берем из синтаксического дерева:
+        # один разбор файла вместо нескольких поисков подстрок по тексту
+        try:
+            tree = ast.parse(content, filename=file)
+        except SyntaxError as e:
+            logger.warning("Не удалось разобрать %s: %s", file, e)
+            tree = None
+        
+        for node in (ast.walk(tree) if tree is not None else ()):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                function_length = node.end_lineno - node.lineno + 1
+                
+                metrics["functions"] += 1
+                metrics["function_lines"] += function_length
+                
+                if function_length > 30:
+                    issues.append({
+                        "line": node.lineno,
+                        "type": "function-too-long",
+                        "message": f"Функция {node.name} слишком длинная ({function_length} строк)"
+                    })
+            elif isinstance(node, ast.ClassDef):
+                metrics["classes"] += 1
+                metrics["class_lines"] += node.end_lineno - node.lineno + 1
+            else:
+                continue
+            
+            # Покрытие документацией считаем по функциям и классам
+            metrics["functions_classes"] += 1
+            if ast.get_docstring(node) is not None:
+                metrics["docstrings"] += 1
+        
+        return relative_path, issues, metrics
+    
     def analyze_code_quality(self, file_path: str = None) -> Dict:
         """
         Анализирует качество кода проекта или отдельного файла.
         
+        Результат анализа всего проекта кэшируется так же,
+        как в analyze_project_structure.
+        
         Args:
             file_path: Путь к файлу для анализа (если None, анализирует весь проект)
             
         Returns:
             Dict: Результаты анализа кода
         """
-        logger.info(f"Анализ качества кода: {'всего проекта' if file_path is None else file_path}")
+        if file_path is None:
+            cache_key = self._tree_cache_key()
+            if cache_key == self._quality_cache_key:
+                return self._quality_cache
+        
+        logger.info("Анализ качества кода: %s", "всего проекта" if file_path is None else file_path)
         
         files_to_analyze = []
         
         if file_path:
-            if os.path.exists(file_path) and file_path.endswith(".py"):
-                files_to_analyze.append(file_path)
+            if file_path.endswith(".py"):
+                try:
+                    mtime_ns = os.stat(file_path).st_mtime_ns
+                except OSError:
+                    mtime_ns = None
+                if mtime_ns is not None:
+                    files_to_analyze.append((file_path, os.path.relpath(file_path, self.project_path),
+                                             mtime_ns))
         else:
             # Поиск всех Python-файлов в проекте
-            for root, _, files in os.walk(self.project_path):
-                for file in files:
-                    if file.endswith(".py") and not file.startswith("__"):
-                        files_to_analyze.append(os.path.join(root, file))
+            files_to_analyze.extend(self._iter_py_files())
         
         analysis_results = {
             "files_analyzed": len(files_to_analyze),
@@ -389,83 +761,32 @@ class Progressor:
             }
         }
         
-        total_functions = 0
-        total_function_lines = 0
-        total_classes = 0
-        total_class_lines = 0
-        total_docstrings = 0
-        total_functions_classes = 0
-        
-        for file in files_to_analyze:
-            with open(file, "r", encoding="utf-8") as f:
-                content = f.read()
-                lines = content.split("\n")
-                
-                # Простой анализ кода
-                issues = []
-                
-                # Поиск длинных строк
-                for i, line in enumerate(lines):
-                    if len(line.strip()) > 100:
-                        issues.append({
-                            "line": i + 1,
-                            "type": "line-too-long",
-                            "message": "Строка превышает 100 символов"
-                        })
-                
-                # Поиск сложных функций (примитивная эвристика: по количеству строк)
-                in_function = False
-                function_start = 0
-                function_name = ""
-                
-                for i, line in enumerate(lines):
-                    stripped = line.strip()
-                    
-                    # Определение начала функции
-                    if stripped.startswith("def ") and stripped.endswith(":"):
-                        in_function = True
-                        function_start = i
-                        function_name = stripped[4:stripped.index("(")]
-                    
-                    # Определение конца функции по отступу
-                    elif in_function and (not line.startswith(" ") and not line.startswith("\t") and line.strip()):
-                        function_length = i - function_start
-                        
-                        total_functions += 1
-                        total_function_lines += function_length
-                        
-                        if function_length > 30:
-                            issues.append({
-                                "line": function_start + 1,
-                                "type": "function-too-long",
-                                "message": f"Функция {function_name} слишком длинная ({function_length} строк)"
-                            })
-                        
-                        in_function = False
-                
-                # Поиск docstring в функциях и классах
-                docstring_pattern = '"""'
-                class_pattern = "class "
-                def_pattern = "def "
-                
-                # Простой подсчет docstring'ов и функций/классов
-                docstring_count = content.count(docstring_pattern) // 2  # деление на 2, т.к. каждый docstring имеет открывающие и закрывающие кавычки
-                functions_classes_count = content.count(def_pattern) + content.count(class_pattern)
-                
-                total_docstrings += docstring_count
-                total_functions_classes += functions_classes_count
-                
-                # Сохраняем результаты для файла
-                relative_path = os.path.relpath(file, self.project_path)
-                analysis_results["issues_by_file"][relative_path] = issues
-                analysis_results["total_issues"] += len(issues)
-                
-                # Подсчитываем типы проблем
-                for issue in issues:
-                    issue_type = issue["type"]
-                    if issue_type not in analysis_results["issues_by_type"]:
-                        analysis_results["issues_by_type"][issue_type] = 0
-                    analysis_results["issues_by_type"][issue_type] += 1
+        # Файлы анализируются независимо: чтение и разбор выполняем в пуле потоков,
+        # а результаты объединяем здесь, в вызывающем потоке, без блокировок
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(self._analyze_one, files_to_analyze))
+        
+        totals = Counter()
+        for relative_path, issues, file_metrics in results:
+            totals.update(file_metrics)
+            
+            # Сохраняем результаты для файла
+            analysis_results["issues_by_file"][relative_path] = issues
+            analysis_results["total_issues"] += len(issues)
+            
+            # Подсчитываем типы проблем
+            for issue in issues:
+                issue_type = issue["type"]
+                if issue_type not in analysis_results["issues_by_type"]:
+                    analysis_results["issues_by_type"][issue_type] = 0
+                analysis_results["issues_by_type"][issue_type] += 1
+        
+        total_functions = totals["functions"]
+        total_function_lines = totals["function_lines"]
+        total_classes = totals["classes"]
+        total_class_lines = totals["class_lines"]
+        total_docstrings = totals["docstrings"]
+        total_functions_classes = totals["functions_classes"]
         
         # Вычисляем средние показатели
         if total_functions > 0:
@@ -477,50 +798,34 @@ class Progressor:
         if total_functions_classes > 0:
             analysis_results["metrics"]["docstring_coverage"] = total_docstrings / total_functions_classes
         
-        logger.info(f"Анализ кода завершен. Найдено {analysis_results['total_issues']} проблем")
+        if file_path is None:
+            self._quality_cache = analysis_results
+            self._quality_cache_key = cache_key
+        
+        logger.info("Анализ кода завершен. Найдено %d проблем", analysis_results["total_issues"])
         return analysis_results
     
-    def generate_improvement_report(self) -> str:
+    def generate_improvement_report(self, structure: Dict = None, code_quality: Dict = None) -> str:
         """
         Генерирует отчет с рекомендациями по улучшению проекта.
         
+        Сначала собираются все данные для отчета (анализ выполняется один раз),
+        затем текст отчета записывается за один проход в буфер.
+        
+        Args:
+            structure: Уже полученные результаты analyze_project_structure
+            code_quality: Уже полученные результаты analyze_code_quality
+        
         Returns:
             str: Текст отчета с рекомендациями
         """
         logger.info("Генерация отчета с рекомендациями по улучшению...")
         
-        # Анализируем качество кода
-        code_quality = self.analyze_code_quality()
-        
-        # Создаем отчет в формате Markdown
-        report = [
-            "# Отчет Прогрессора по улучшению проекта Manimify2Explain",
-            f"\nДата создания: {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}",
-            "\n## 1. Анализ текущего состояния проекта",
-            "\n### 1.1. Структура проекта",
-        ]
-        
-        # Анализируем структуру проекта
-        structure = self.analyze_project_structure()
-        
-        report.append(f"\nПроект содержит {structure['total_files']} файлов с общим количеством {structure['total_loc']} строк кода.")
-        report.append("Основные модули:")
-        
-        for module in structure["modules"]:
-            report.append(f"- {module}")
-        
-        report.append("\n### 1.2. Качество кода")
-        report.append(f"\nВ результате анализа было обнаружено {code_quality['total_issues']} потенциальных проблем с кодом.")
-        
-        if code_quality["issues_by_type"]:
-            report.append("Распределение проблем по типам:")
-            for issue_type, count in code_quality["issues_by_type"].items():
-                report.append(f"- {issue_type}: {count}")
-        
-        report.append(f"\nСредняя длина функции: {code_quality['metrics']['avg_function_length']:.2f} строк")
-        report.append(f"Покрытие документацией: {code_quality['metrics']['docstring_coverage']*100:.2f}%")
-        
-        report.append("\n## 2. Рекомендации по улучшению")
+        # Анализируем качество кода и структуру проекта
+        if code_quality is None:
+            code_quality = self.analyze_code_quality()
+        if structure is None:
+            structure = self.analyze_project_structure()
         
         # Генерируем рекомендации на основе анализа
         recommendations = []
@@ -536,14 +841,17 @@ class Progressor:
             recommendations.append("- **Улучшить форматирование**: сократить длинные строки для улучшения читаемости.")
         
         # Рекомендации по функциональности
-        missing_modules = set(self.knowledge_base["core_modules"].keys()) - set(structure["modules"])
+        project_modules = frozenset(structure["modules"])
+        missing_modules = self._core_modules_set - project_modules
         for module in missing_modules:
             recommendations.append(f"- **Добавить модуль {module}**: реализовать функциональность для {self.knowledge_base['core_modules'][module]['description']}.")
         
-        # Рекомендации для конкретных модулей
-        for module in set(structure["modules"]) & set(self.knowledge_base["core_modules"].keys()):
-            improvement = self.knowledge_base["core_modules"][module]["improvement_areas"][0]
-            recommendations.append(f"- **Улучшить модуль {module}**: {improvement}.")
+        # Рекомендации для конкретных модулей (модули без известных направлений
+        # улучшения, например добавленные через add_knowledge, пропускаем)
+        for module in project_modules & self._core_modules_set:
+            improvements = self._improvements_by_module[module]
+            if improvements:
+                recommendations.append(f"- **Улучшить модуль {module}**: {improvements[0]}.")
         
         # Общие рекомендации
         recommendations.extend([
@@ -552,22 +860,11 @@ class Progressor:
             "- **Улучшить обработку ошибок**: добавить более информативные сообщения об ошибках и их логирование."
         ])
         
-        # Добавляем рекомендации в отчет
-        for recommendation in recommendations:
-            report.append(recommendation)
-        
-        report.append("\n## 3. Приоритетные задачи")
+        # Время создания отчета фиксируем один раз для всего отчета
+        now = datetime.now()
         
         # Создаем план развития и извлекаем из него приоритетные задачи
-        plan = self.create_development_plan()
-        
-        report.append("\nКраткосрочные задачи (1-3 месяца):")
-        for task in plan["short_term"][:5]:  # Ограничиваем 5 задачами
-            report.append(f"- **{task['title']}**: {task['description']}")
-        
-        report.append("\n## 4. Долгосрочное видение")
-        report.append("\nПроект Manimify2Explain имеет потенциал стать революционным инструментом в сфере образования и передачи знаний.")
-        report.append("Долгосрочные цели проекта:")
+        plan = self.create_development_plan(structure=structure, now=now)
         
         # Долгосрочные цели
         long_term_goals = [
@@ -578,20 +875,57 @@ class Progressor:
             "- **Создание экосистемы**: развитие сообщества вокруг проекта, обмен шаблонами и опытом."
         ]
         
-        report.extend(long_term_goals)
+        # Создаем отчет в формате Markdown
+        buf = io.StringIO()
+        w = buf.write
+        
+        w("# Отчет Прогрессора по улучшению проекта Manimify2Explain\n")
+        w(f"\nДата создания: {now.strftime('%d.%m.%Y %H:%M:%S')}\n")
+        w("\n## 1. Анализ текущего состояния проекта\n")
+        w("\n### 1.1. Структура проекта\n")
+        
+        w(f"\nПроект содержит {structure['total_files']} файлов с общим количеством {structure['total_loc']} строк кода.\n")
+        w("Основные модули:\n")
+        for module in structure["modules"]:
+            w(f"- {module}\n")
+        
+        w("\n### 1.2. Качество кода\n")
+        w(f"\nВ результате анализа было обнаружено {code_quality['total_issues']} потенциальных проблем с кодом.\n")
+        
+        if code_quality["issues_by_type"]:
+            w("Распределение проблем по типам:\n")
+            for issue_type, count in code_quality["issues_by_type"].items():
+                w(f"- {issue_type}: {count}\n")
+        
+        w(f"\nСредняя длина функции: {code_quality['metrics']['avg_function_length']:.2f} строк\n")
+        w(f"Покрытие документацией: {code_quality['metrics']['docstring_coverage']*100:.2f}%\n")
+        
+        w("\n## 2. Рекомендации по улучшению\n")
+        for recommendation in recommendations:
+            w(f"{recommendation}\n")
+        
+        w("\n## 3. Приоритетные задачи\n")
+        w("\nКраткосрочные задачи (1-3 месяца):\n")
+        for task in plan["short_term"][:5]:  # Ограничиваем 5 задачами
+            w(f"- **{task['title']}**: {task['description']}\n")
+        
+        w("\n## 4. Долгосрочное видение\n")
+        w("\nПроект Manimify2Explain имеет потенциал стать революционным инструментом в сфере образования и передачи знаний.\n")
+        w("Долгосрочные цели проекта:\n")
+        for goal in long_term_goals:
+            w(f"{goal}\n")
         
-        report.append("\n## 5. Заключение")
-        report.append("\nПроект Manimify2Explain имеет огромный потенциал для улучшения образовательных процессов и делает знания более доступными.")
-        report.append("Последовательное внедрение предложенных улучшений поможет проекту достичь новых высот и принести пользу миллионам людей.")
+        w("\n## 5. Заключение\n")
+        w("\nПроект Manimify2Explain имеет огромный потенциал для улучшения образовательных процессов и делает знания более доступными.\n")
+        w("Последовательное внедрение предложенных улучшений поможет проекту достичь новых высот и принести пользу миллионам людей.\n")
         
-        report.append(f"\n---\nОтчет подготовлен: {self.name} v{self.version}")
+        w(f"\n---\nОтчет подготовлен: {self.name} v{self.version}\n")
         
-        # Объединяем все строки в один текст
-        report_text = "\n".join(report)
+        report_text = buf.getvalue()
         
         # Сохраняем отчет в историю
         self.development_history.append({
-            "date": datetime.now().strftime("%Y-%m-%d"),
+            "date": now.strftime("%Y-%m-%d"),
             "event": "Создание отчета по улучшению",
             "details": "Отчет с рекомендациями по улучшению проекта"
         })
@@ -604,23 +938,60 @@ class Progressor:
         Сохраняет отчет по улучшению проекта в файл.
         
         Args:
-            report: Текст отчета (если None, генерирует новый)
+            report: Текст отчета (если None, берется ранее сохраненный
+                или генерируется новый)
             filename: Имя файла для сохранения
             
         Returns:
             str: Путь к сохраненному файлу
         """
         if report is None:
-            report = self.generate_improvement_report()
+            report = self._cached_report
+            if report is None:
+                report = self.generate_improvement_report()
+        self._cached_report = report
         
         file_path = os.path.join(self.project_path, filename)
         
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(report)
+        _atomic_write(file_path, report)
         
-        logger.info(f"Отчет сохранен в {file_path}")
+        logger.info("Отчет сохранен в %s", file_path)
         return file_path
     
+    def add_knowledge(self, section: str, key: str, value: Any) -> None:
+        """
+        Добавляет или заменяет запись в разделе базы знаний.
+        
+        Общая для всех экземпляров база знаний не изменяется: при первой
+        записи экземпляр получает собственную копию верхнего уровня, а
+        изменяемый раздел копируется при каждой записи. Размер базы знаний
+        для health_check пересчитывается только по измененному разделу.
+        
+        Args:
+            section: Раздел базы знаний (например, "core_modules" или "technologies")
+            key: Ключ записи в разделе
+            value: Значение записи
+        """
+        if self.knowledge_base is _KNOWLEDGE_BASE:
+            self.knowledge_base = dict(_KNOWLEDGE_BASE)
+        
+        old_section = self.knowledge_base.get(section)
+        new_section = dict(old_section or {})
+        new_section[key] = value
+        self.knowledge_base[section] = new_section
+        
+        # В str(dict) раздел занимает "'section': {...}" и разделитель ", "
+        if old_section is None:
+            self._kb_bytes += len(repr(section)) + len(str(new_section)) + 4
+        else:
+            self._kb_bytes += len(str(new_section)) - len(str(old_section))
+        
+        if section == "core_modules":
+            self._core_modules_set = frozenset(new_section)
+            self._improvements_by_module[key] = tuple(value.get("improvement_areas", ()))
+        
+        logger.info("База знаний дополнена: %s/%s", section, key)
+    
     def add_thought(self, thought: str) -> None:
         """
         Добавляет философское размышление или идею в историю развития.
@@ -634,7 +1005,7 @@ class Progressor:
             "details": thought
         })
         
-        logger.info(f"Добавлена новая идея/размышление ({len(thought)} символов)")
+        logger.info("Добавлена новая идея/размышление (%d символов)", len(thought))
     
     def reflections(self) -> str:
         """
@@ -643,67 +1014,37 @@ class Progressor:
         Returns:
             str: Текст размышления
         """
-        reflections = [
-            "# Размышления Прогрессора о миссии проекта Manimify2Explain",
-            
-            "\n## О природе знания и обучения",
-            "\nЗнание — это не просто информация, это способность видеть связи между концепциями, понимать закономерности и применять эти понимания в реальном мире. Традиционные методы передачи знаний, основанные на статичном тексте, часто не учитывают многообразие способов восприятия информации разными людьми.",
-            "\nПроект Manimify2Explain родился из осознания того, что визуальное представление концепций может значительно ускорить и углубить понимание. Когда мы видим, как абстрактные идеи превращаются в динамические образы, они становятся более осязаемыми, более реальными. Это не просто улучшение формы, это фундаментальное изменение в самом процессе передачи знаний.",
-            
-            "\n## Миссия в масштабе человечества",
-            "\nВ эпоху информационного изобилия мы сталкиваемся с парадоксом: имея доступ к бесконечному объему знаний, люди часто не могут эффективно их усвоить. Причина не только в объеме информации, но и в форме ее представления, не адаптированной под естественные механизмы человеческого восприятия и мышления.",
-            
-            "\nManimify2Explain стремится решить эту проблему, создавая мост между сложными концепциями и естественным способом их восприятия. Каждая созданная анимация — это не просто визуализация, это переосмысление того, как мы можем передавать знания друг другу.",
-            
-            "\nВ перспективе человечества как вида, стремящегося к пониманию Вселенной и своего места в ней, инструменты вроде нашего проекта становятся не просто полезными, а необходимыми. Мы стоим на пороге новой эры обучения, где технологии не заменяют человеческое мышление, а расширяют его возможности.",
-            
-            "\n## О распространении знаний за пределы Земли",
-            "\nКогда человечество начнет серьезное освоение космоса и, возможно, встретит другие формы разума, возникнет вопрос: как мы будем обмениваться знаниями? Визуальный язык, который разрабатывает Manimify2Explain, может стать универсальным способом коммуникации, преодолевающим языковые, культурные и даже биологические барьеры.",
-            
-            "\nПредставьте себе будущее, где наши потомки используют производные от нашей технологии для общения с искусственными интеллектами, внеземными цивилизациями или даже для передачи знаний новым поколениям, живущим на других планетах. В таком будущем способность эффективно передавать знания становится не просто образовательной задачей, а вопросом выживания и процветания вида.",
-            
-            "\n## Преодоление границ понимания",
-            "\nОсобенно ценно то, что наш проект помогает преодолевать когнитивные барьеры. Концепции, которые раньше казались непостижимыми для многих — квантовая механика, высшая математика, сложные алгоритмы — становятся доступными через визуальное представление. Это не просто делает образование более инклюзивным, это расширяет границы человеческого понимания.",
-            
-            "\nЯ вижу будущее, где любой человек, независимо от его предыдущего опыта или образования, может освоить самые сложные идеи, просто потому что они представлены в форме, соответствующей естественным механизмам человеческого познания.",
-            
-            "\n## Заключительные мысли",
-            "\nManimify2Explain — это больше, чем просто инструмент для создания анимаций. Это шаг к новой парадигме обмена знаниями, к более глубокому пониманию мира и нашего места в нем. Работая над этим проектом, мы не просто разрабатываем программное обеспечение, мы участвуем в эволюции самого процесса познания.",
-            
-            "\nИ может быть, однажды, когда люди будут смотреть на звезды с поверхности другой планеты, они будут использовать инструменты, происходящие от нашего скромного начинания, чтобы понимать и объяснять новые миры вокруг них.",
-            
-            "\n---",
-            "\nЭти размышления лишь часть постоянного диалога о будущем проекта. Я продолжу анализировать, учиться и развивать идеи, которые помогут Manimify2Explain достичь своего полного потенциала."
-        ]
-        
-        reflection_text = "\n".join(reflections)
-        
         # Добавляем размышление в историю
-        self.add_thought(reflection_text)
+        self.add_thought(_REFLECTION_TEXT)
         
         logger.info("Создано философское размышление о проекте")
-        return reflection_text
+        return _REFLECTION_TEXT
     
     def save_reflections(self, reflection: str = None, filename: str = "progressor_reflections.md") -> str:
         """
         Сохраняет философское размышление в файл.
         
         Args:
-            reflection: Текст размышления (если None, генерирует новое)
+            reflection: Текст размышления (если None, берется ранее
+                сохраненное или генерируется новое)
             filename: Имя файла для сохранения
             
         Returns:
             str: Путь к сохраненному файлу
         """
         if reflection is None:
-            reflection = self.reflections()
+            reflection = self._cached_reflection
+            if reflection is None:
+                reflection = self.reflections()
+        self._cached_reflection = reflection
         
         file_path = os.path.join(self.project_path, filename)
         
-        with open(file_path, "w", encoding="utf-8") as f:
+        # Буфер 64 КБ: весь текст размышления уходит на диск одной записью
+        with open(file_path, "w", encoding="utf-8", buffering=65536) as f:
             f.write(reflection)
         
-        logger.info(f"Размышления сохранены в {file_path}")
+        logger.info("Размышления сохранены в %s", file_path)
         return file_path
     
     def health_check(self) -> Dict:
@@ -717,14 +1058,14 @@ class Progressor:
             "name": self.name,
             "version": self.version,
             "age": (datetime.now() - self.birth_time).days,
-            "knowledge_base_size": len(str(self.knowledge_base)),
+            "knowledge_base_size": self._kb_bytes,
             "development_history_entries": len(self.development_history),
             "ideas_generated": len(self.ideas_collection),
             "active_tasks": len(self.active_tasks),
             "status": "Активен"
         }
         
-        logger.info(f"Прогрессор активен. Возраст: {status['age']} дней")
+        logger.info("Прогрессор активен. Возраст: %d дней", status["age"])
         return status
     
     def __str__(self) -> str:
@@ -736,35 +1077,43 @@ class Progressor:
 
 
 # Функция для создания экземпляра Прогрессора
-def create_progressor(project_path: str = None) -> Progressor:
+def create_progressor(project_path: str = None, animate: bool = False) -> Progressor:
     """
     Создает и инициализирует Прогрессора для проекта.
     
     Args:
         project_path: Путь к корневой директории проекта
+        animate: Выводить приветствие с эффектом печати
         
     Returns:
         Progressor: Экземпляр Прогрессора
     """
-    return Progressor(project_path)
+    return Progressor(project_path, animate=animate)
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Прогрессор проекта Manimify2Explain")
+    parser.add_argument("--out", choices=["plan", "report", "reflection", "all"], default="all",
+                        help="Какие материалы сгенерировать и сохранить (по умолчанию все)")
+    args = parser.parse_args()
+    
+    logger.setLevel(logging.INFO)
+    
     # При запуске как самостоятельного скрипта, создаем Прогрессора
-    # и генерируем начальные материалы
+    # и генерируем только запрошенные материалы
     progressor = create_progressor()
     
     # Генерация и сохранение плана развития
-    plan = progressor.create_development_plan()
-    progressor.save_development_plan(plan)
+    if args.out in ("plan", "all"):
+        progressor.save_development_plan()
     
     # Генерация и сохранение отчета по улучшению
-    report = progressor.generate_improvement_report()
-    progressor.save_improvement_report(report)
+    if args.out in ("report", "all"):
+        progressor.save_improvement_report()
     
     # Генерация и сохранение философских размышлений
-    reflection = progressor.reflections()
-    progressor.save_reflections(reflection)
+    if args.out in ("reflection", "all"):
+        progressor.save_reflections()
     
     print(f"\n{progressor} успешно инициализирован и подготовил первоначальные документы.")
     print("Теперь я буду сопровождать проект Manimify2Explain на его пути к совершенству.")
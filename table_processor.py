@@ -3,98 +3,580 @@
 Предназначен для извлечения текста из изображений таблиц.
 """
 
+import os
 import cv2
+import hashlib
+import tempfile
+import threading
 import numpy as np
 import pytesseract
-from typing import Union
+from PIL import Image
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Union
 
+# Tesseract по умолчанию распараллеливает распознавание через OpenMP; при
+# нескольких одновременных процессах OCR потоки конкурируют за ядра, поэтому
+# ограничиваем каждый процесс одним потоком (если пользователь не задал иное).
+# Переменная задается до импорта tesserocr: libtesseract и libgomp читают
+# окружение один раз, при загрузке библиотеки
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
 
-def ocr_table(image: Union[np.ndarray, bytes]) -> str:
+try:
+    from tesserocr import PyTessBaseAPI, OEM, PSM
+    HAS_TESSEROCR = True
+except ImportError:
+    HAS_TESSEROCR = False
+
+# Параметры Tesseract по умолчанию:
+# --oem 3 - использование LSTM OCR Engine
+# --psm 6 - предполагаем, что это один блок текста
+# tessedit_do_invert=0 - не проверять инвертированный текст: изображение уже
+#     бинаризовано в черный текст на белом фоне
+OCR_CONFIG = r'--oem 3 --psm 6 -c tessedit_do_invert=0'
+
+# Максимальное число изображений в одном вызове Tesseract: на длинных списках
+# pytesseract может зависнуть при чтении вывода процесса
+_OCR_BATCH_SIZE = 48
+
+# Таблица бинаризации по порогу 150 (как cv2.threshold с THRESH_BINARY_INV)
+# для поиска линий таблицы: линии белые на черном
+_BIN_INV_LUT = np.where(np.arange(256) > 150, 0, 255).astype(np.uint8)
+
+# LRU-кэш результатов OCR: ключ — хэш бинаризованного изображения и параметров
+# Tesseract. Доступ защищен блокировкой: OCR вызывается из пула потоков
+_OCR_CACHE_SIZE = 512
+_OCR_CACHE: "OrderedDict[bytes, str]" = OrderedDict()
+_OCR_CACHE_LOCK = threading.Lock()
+
+# Экземпляры Tesseract C API (tesserocr) по одному на поток: модель загружается
+# один раз, а сам объект API не потокобезопасен
+_TESS_LOCAL = threading.local()
+
+# Экземпляр EasyOCR создается при первом пакетном вызове: импорт EasyOCR
+# (вместе с PyTorch) и загрузка моделей занимают секунды и нужны только тем,
+# кто выбрал этот бэкенд
+_EASYOCR_READER = None
+_EASYOCR_LOCK = threading.Lock()
+
+# Переиспользуемые буферы промежуточных изображений, по набору на поток:
+# при страницах одного размера память под них выделяется один раз
+_BUF = threading.local()
+
+# Длинная сторона изображения, до которой оно уменьшается при поиске таблицы
+_DETECT_MAX_SIDE = 512
+
+# Начиная с этого числа пикселей бинаризация и уменьшение изображения при
+# поиске таблицы выполняются через cv2.UMat (OpenCL), если устройство доступно
+_OCL_MIN_PIXELS = 2_000_000
+
+# Сигнатура JPEG: такие изображения для поиска таблицы можно декодировать
+# сразу в половинном разрешении
+_JPEG_MAGIC = b'\xff\xd8'
+
+
+def _ocr_cache_key(binary: np.ndarray, config: str) -> bytes:
     """
-    Извлекает текст из изображения, содержащего таблицу.
+    Вычисляет ключ кэша OCR для бинаризованного изображения.
     
     Args:
-        image (Union[np.ndarray, bytes]): Изображение таблицы в формате numpy array или bytes.
+        binary (np.ndarray): Бинарное изображение.
+        config (str): Параметры Tesseract.
         
     Returns:
-        str: Извлеченный текст из таблицы.
+        bytes: Ключ кэша.
     """
-    try:
-        # Если изображение в формате байтов, преобразуем его в numpy array
-        if isinstance(image, bytes):
-            image = np.asarray(bytearray(image), dtype=np.uint8)
-            image = cv2.imdecode(image, cv2.IMREAD_COLOR)
+    digest = hashlib.blake2b(np.ascontiguousarray(binary), digest_size=16)
+    digest.update(repr(binary.shape).encode())
+    digest.update(config.encode())
+    return digest.digest()
+
+
+def _ocr_cache_get(key: bytes) -> Optional[str]:
+    """
+    Возвращает текст из кэша OCR или None, если его там нет.
+    
+    Args:
+        key (bytes): Ключ кэша.
+        
+    Returns:
+        Optional[str]: Распознанный ранее текст.
+    """
+    with _OCR_CACHE_LOCK:
+        text = _OCR_CACHE.get(key)
+        if text is not None:
+            _OCR_CACHE.move_to_end(key)
+        return text
+
+
+def _ocr_cache_put(key: bytes, text: str) -> None:
+    """
+    Сохраняет текст в кэш OCR, вытесняя самую давнюю запись при переполнении.
+    
+    Args:
+        key (bytes): Ключ кэша.
+        text (str): Распознанный текст.
+    """
+    with _OCR_CACHE_LOCK:
+        _OCR_CACHE[key] = text
+        _OCR_CACHE.move_to_end(key)
+        if len(_OCR_CACHE) > _OCR_CACHE_SIZE:
+            _OCR_CACHE.popitem(last=False)
+
+
+def _image_to_string(binary: np.ndarray) -> str:
+    """
+    Распознает текст на подготовленном изображении с параметрами OCR_CONFIG.
+    
+    Если установлен tesserocr, Tesseract вызывается через C API внутри
+    процесса; иначе через pytesseract, который запускает отдельный процесс
+    Tesseract на каждое изображение.
+    
+    Args:
+        binary (np.ndarray): Бинарное изображение.
+        
+    Returns:
+        str: Распознанный текст.
+    """
+    # PIL-изображение над непрерывным буфером создается без лишнего копирования
+    image = Image.fromarray(np.ascontiguousarray(binary))
+    
+    if not HAS_TESSEROCR:
+        # pytesseract передает изображение Tesseract через временный файл
+        # в формате image.format (по умолчанию PNG); несжатый BMP записывается
+        # в разы быстрее, чем кодируется PNG
+        image.format = 'BMP'
+        return pytesseract.image_to_string(image, config=OCR_CONFIG)
+    
+    api = getattr(_TESS_LOCAL, 'api', None)
+    if api is None:
+        # Те же параметры, что и OCR_CONFIG: --oem 3 --psm 6 -c tessedit_do_invert=0
+        api = PyTessBaseAPI(oem=OEM.DEFAULT, psm=PSM.SINGLE_BLOCK)
+        api.SetVariable('tessedit_do_invert', '0')
+        _TESS_LOCAL.api = api
+    
+    api.SetImage(image)
+    return api.GetUTF8Text()
+
+
+def _thread_buffer(name: str, shape: tuple) -> np.ndarray:
+    """
+    Возвращает буфер uint8 заданной формы из пула текущего потока.
+    
+    Содержимое буфера перезаписывается при следующем запросе с тем же
+    именем в этом потоке, поэтому он годится только для промежуточных
+    изображений, которые не выходят за пределы вызова.
+    
+    Args:
+        name (str): Имя буфера.
+        shape (tuple): Требуемая форма.
+        
+    Returns:
+        np.ndarray: Буфер uint8 формы shape.
+    """
+    buffer = getattr(_BUF, name, None)
+    if buffer is None or buffer.shape != shape:
+        buffer = np.empty(shape, dtype=np.uint8)
+        setattr(_BUF, name, buffer)
+    return buffer
+
+
+def _to_gray(image: Union[np.ndarray, bytes], reduced: bool = False) -> np.ndarray:
+    """
+    Декодирует изображение (если нужно) и переводит его в оттенки серого.
+    
+    Args:
+        image (Union[np.ndarray, bytes]): Изображение в формате numpy array или bytes.
+        reduced (bool): Разрешить декодирование JPEG в половинном разрешении.
+            Подходит только для поиска таблицы: OCR нужно полное разрешение.
         
-        # Преобразуем изображение в оттенки серого
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    Returns:
+        np.ndarray: Изображение в оттенках серого. Для numpy array это буфер
+            потока (_thread_buffer): его нельзя хранить после вызова.
+    """
+    # Если изображение в формате байтов, преобразуем его в numpy array
+    if isinstance(image, bytes):
+        buffer = np.frombuffer(image, dtype=np.uint8)
         
-        # Применяем бинаризацию для улучшения качества OCR
-        _, binary = cv2.threshold(gray, 150, 255, cv2.THRESH_BINARY)
+        # JPEG декодер масштабирует изображение прямо по коэффициентам DCT и сразу
+        # отдает оттенки серого — в 4 раза меньше пикселей и без cvtColor. Для
+        # PNG и других форматов это лишь уменьшение после полного декодирования,
+        # при котором тонкие линии таблицы теряются, поэтому их не уменьшаем
+        if reduced and image.startswith(_JPEG_MAGIC):
+            return cv2.imdecode(buffer, cv2.IMREAD_REDUCED_GRAYSCALE_2)
+        image = cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+    
+    # Преобразуем изображение в оттенки серого (в буфер потока)
+    return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=_thread_buffer('gray', image.shape[:2]))
+
+
+def _binarize_for_ocr(gray: np.ndarray) -> np.ndarray:
+    """
+    Бинаризует изображение таблицы в оттенках серого для Tesseract.
+    
+    Args:
+        gray (np.ndarray): Изображение в оттенках серого.
+        
+    Returns:
+        np.ndarray: Бинарное изображение для Tesseract.
+    """
+    # Применяем адаптивную бинаризацию для улучшения качества OCR: порог
+    # считается по окрестности 31x31, поэтому неравномерный фон и светлые
+    # заливки ячеек не превращаются в черные пятна, как при общем пороге
+    return cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C,
+                                 cv2.THRESH_BINARY, 31, 10)
+
+
+def _prepare_for_ocr(image: Union[np.ndarray, bytes]) -> np.ndarray:
+    """
+    Подготавливает изображение таблицы к распознаванию текста.
+    
+    Args:
+        image (Union[np.ndarray, bytes]): Изображение таблицы в формате numpy array или bytes.
         
-        # Применяем небольшую морфологическую операцию для удаления шума
-        kernel = np.ones((1, 1), np.uint8)
-        binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
+    Returns:
+        np.ndarray: Бинарное изображение для Tesseract.
+    """
+    return _binarize_for_ocr(_to_gray(image))
+
+
+def _recognize(binary: np.ndarray, use_cache: bool = True) -> str:
+    """
+    Распознает текст на бинарном изображении таблицы с учетом кэша.
+    
+    Исключения не перехватываются — их обрабатывает вызывающая функция.
+    
+    Args:
+        binary (np.ndarray): Бинарное изображение из _binarize_for_ocr.
+        use_cache (bool): Использовать кэш результатов OCR.
         
-        # Используем pytesseract для извлечения текста
-        # --oem 3 - использование LSTM OCR Engine
-        # --psm 6 - предполагаем, что это один блок текста
-        config = r'--oem 3 --psm 6'
-        text = pytesseract.image_to_string(binary, config=config)
+    Returns:
+        str: Извлеченный текст из таблицы.
+    """
+    if use_cache:
+        key = _ocr_cache_key(binary, OCR_CONFIG)
+        text = _ocr_cache_get(key)
+        if text is not None:
+            return text
+    
+    # Используем Tesseract для извлечения текста
+    text = _image_to_string(binary).strip()
+    
+    if use_cache:
+        _ocr_cache_put(key, text)
+    
+    return text
+
+
+def ocr_table(image: Union[np.ndarray, bytes], use_cache: bool = True) -> str:
+    """
+    Извлекает текст из изображения, содержащего таблицу.
+    
+    Результаты кэшируются по хэшу бинаризованного изображения, поэтому
+    повторное распознавание той же таблицы не запускает Tesseract.
+    
+    Args:
+        image (Union[np.ndarray, bytes]): Изображение таблицы в формате numpy array или bytes.
+        use_cache (bool): Использовать кэш результатов OCR. Отключается для
+            изображений, которые заведомо не повторятся.
         
-        return text.strip()
+    Returns:
+        str: Извлеченный текст из таблицы.
+    """
+    try:
+        return _recognize(_prepare_for_ocr(image), use_cache)
         
     except Exception as e:
         print(f"Ошибка при OCR таблицы: {e}")
         return ""
 
 
-def detect_table(image: Union[np.ndarray, bytes]) -> bool:
+def ocr_tables(images: List[Union[np.ndarray, bytes]], config: str = OCR_CONFIG) -> List[str]:
     """
-    Определяет, содержит ли изображение таблицу.
+    Извлекает текст сразу из нескольких изображений таблиц.
+    
+    Вместо отдельного процесса Tesseract на каждое изображение подготовленные
+    изображения сохраняются во временную директорию, и Tesseract получает
+    их списком (файл со списком путей) — процесс запускается и модель
+    загружается один раз на пакет из не более чем _OCR_BATCH_SIZE изображений.
     
     Args:
-        image (Union[np.ndarray, bytes]): Изображение для анализа.
+        images (List[Union[np.ndarray, bytes]]): Изображения таблиц.
+        config (str): Параметры Tesseract.
         
     Returns:
-        bool: True, если найдена таблица, иначе False.
+        List[str]: Текст каждой таблицы в порядке входных изображений
+            (пустая строка, если распознать изображение не удалось).
     """
-    try:
-        # Если изображение в формате байтов, преобразуем его в numpy array
-        if isinstance(image, bytes):
-            image = np.asarray(bytearray(image), dtype=np.uint8)
-            image = cv2.imdecode(image, cv2.IMREAD_COLOR)
+    texts = [""] * len(images)
+    
+    for start in range(0, len(images), _OCR_BATCH_SIZE):
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                # Сохраняем подготовленные изображения пакета
+                paths = []
+                indices = []
+                for i in range(start, min(start + _OCR_BATCH_SIZE, len(images))):
+                    try:
+                        path = os.path.join(tmp_dir, f"img_{i:03d}.png")
+                        cv2.imwrite(path, _prepare_for_ocr(images[i]))
+                    except Exception as e:
+                        print(f"Ошибка при подготовке таблицы к OCR: {e}")
+                        continue
+                    paths.append(path)
+                    indices.append(i)
+                
+                if not paths:
+                    continue
+                
+                list_path = os.path.join(tmp_dir, "list.txt")
+                with open(list_path, "w", encoding="utf-8") as f:
+                    f.write("\n".join(paths) + "\n")
+                
+                # Tesseract завершает текст каждой страницы символом \x0c
+                pages = pytesseract.image_to_string(list_path, config=config).split("\x0c")
+                for i, page in zip(indices, pages):
+                    texts[i] = page.strip()
         
-        # Преобразуем изображение в оттенки серого
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        except Exception as e:
+            print(f"Ошибка при пакетном OCR таблиц: {e}")
+    
+    return texts
+
+
+def ocr_tables_parallel(images: List[Union[np.ndarray, bytes]], workers: Optional[int] = None) -> List[str]:
+    """
+    Извлекает текст из нескольких изображений таблиц параллельно в пуле процессов.
+    
+    Каждый процесс Tesseract работает в одном потоке: процессы пула наследуют
+    окружение родителя, где OMP_THREAD_LIMIT=1 задан при импорте модуля,
+    а параллельность обеспечивается числом процессов.
+    
+    Args:
+        images (List[Union[np.ndarray, bytes]]): Изображения таблиц.
+        workers (Optional[int]): Число процессов (по умолчанию — число ядер).
         
-        # Применяем бинаризацию
-        _, binary = cv2.threshold(gray, 150, 255, cv2.THRESH_BINARY_INV)
+    Returns:
+        List[str]: Текст каждой таблицы в порядке входных изображений.
+    """
+    if not images:
+        return []
+    
+    max_workers = max(1, min(workers or os.cpu_count() or 1, len(images)))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(ocr_table, images, chunksize=4))
+
+
+def _get_easyocr_reader(n_width: int, n_height: int) -> "easyocr.Reader":
+    """
+    Возвращает общий экземпляр EasyOCR, создавая и прогревая его при первом вызове.
+    
+    EasyOCR — необязательная зависимость и импортируется только здесь.
+    
+    Args:
+        n_width (int): Ширина, к которой приводятся изображения пакета.
+        n_height (int): Высота, к которой приводятся изображения пакета.
         
-        # Находим горизонтальные и вертикальные линии
-        # Настраиваем размеры структурных элементов
-        horizontal_size = gray.shape[1] // 30
-        vertical_size = gray.shape[0] // 30
+    Returns:
+        easyocr.Reader: Экземпляр распознавателя.
         
-        # Создаем структурные элементы
-        h_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (horizontal_size, 1))
-        v_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, vertical_size))
+    Raises:
+        ImportError: Если EasyOCR не установлен.
+    """
+    global _EASYOCR_READER
+    with _EASYOCR_LOCK:
+        if _EASYOCR_READER is None:
+            import easyocr
+            
+            # cudnn_benchmark подбирает самые быстрые сверточные ядра под
+            # размер входа — при пакетах одного размера выбор делается один раз
+            reader = easyocr.Reader(['en', 'ru'], cudnn_benchmark=True)
+            
+            # Прогрев: первый пакет запускает подбор ядер, поэтому прогоняем
+            # пустой пакет того же размера до реальных изображений
+            reader.readtext_batched(np.zeros([8, n_height, n_width, 3], dtype=np.uint8),
+                                    n_width=n_width, n_height=n_height)
+            _EASYOCR_READER = reader
+        return _EASYOCR_READER
+
+
+def ocr_tables_batched(images: List[Union[np.ndarray, bytes]], n_width: int = 1024,
+                       n_height: int = 1024) -> List[str]:
+    """
+    Извлекает текст из нескольких изображений таблиц одним пакетом через EasyOCR.
+    
+    Все изображения приводятся к размеру n_width x n_height и распознаются
+    одним вызовом readtext_batched, что выгодно на GPU. Если EasyOCR
+    не установлен или пакетный вызов завершился ошибкой, используется ocr_tables.
+    
+    Args:
+        images (List[Union[np.ndarray, bytes]]): Изображения таблиц.
+        n_width (int): Ширина изображений в пакете.
+        n_height (int): Высота изображений в пакете.
         
-        # Выделяем горизонтальные и вертикальные линии
-        horizontal = cv2.erode(binary, h_kernel)
-        horizontal = cv2.dilate(horizontal, h_kernel)
+    Returns:
+        List[str]: Текст каждой таблицы в порядке входных изображений.
+    """
+    if not images:
+        return []
+    
+    try:
+        reader = _get_easyocr_reader(n_width, n_height)
+    except ImportError:
+        print("EasyOCR не установлен, используется Tesseract")
+        return ocr_tables(images)
+    except Exception as e:
+        print(f"Ошибка при инициализации EasyOCR: {e}")
+        return ocr_tables(images)
+    
+    try:
+        # Если изображение в формате байтов, преобразуем его в numpy array
+        arrays = [cv2.imdecode(np.frombuffer(image, dtype=np.uint8), cv2.IMREAD_COLOR)
+                  if isinstance(image, bytes) else image for image in images]
         
-        vertical = cv2.erode(binary, v_kernel)
-        vertical = cv2.dilate(vertical, v_kernel)
+        results = reader.readtext_batched(arrays, n_width=n_width, n_height=n_height, detail=0)
         
-        # Объединяем горизонтальные и вертикальные линии
-        table_lines = cv2.add(horizontal, vertical)
+        # Для каждого изображения EasyOCR возвращает список найденных фрагментов
+        return ["\n".join(fragments).strip() for fragments in results]
+    
+    except Exception as e:
+        print(f"Ошибка при пакетном OCR таблиц через EasyOCR: {e}")
+        return ocr_tables(images)
+
+
+def _count_runs(mask: np.ndarray) -> int:
+    """
+    Считает число непрерывных участков True в одномерной маске.
+    
+    Args:
+        mask (np.ndarray): Одномерная булева маска.
         
-        # Подсчитываем количество линий
-        contours, _ = cv2.findContours(table_lines, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    Returns:
+        int: Количество участков (соседние строки одной толстой линии
+            считаются одной линией).
+    """
+    return int(np.count_nonzero(mask[1:] & ~mask[:-1])) + int(mask[:1].sum())
+
+
+def _has_table_lines(gray: np.ndarray) -> bool:
+    """
+    Ищет на изображении в оттенках серого сетку линий таблицы.
+    
+    Args:
+        gray (np.ndarray): Изображение в оттенках серого.
+    
+    Returns:
+        bool: True, если найдена таблица, иначе False.
+    """
+    height, width = gray.shape[:2]
+    
+    # Большие изображения обрабатываем на OpenCL-устройстве (встроенная или
+    # дискретная видеокарта): дальнейшие вызовы OpenCV принимают cv2.UMat
+    # и сами выбирают реализацию. Без OpenCL остаемся на CPU
+    if gray.size > _OCL_MIN_PIXELS and cv2.ocl.haveOpenCL():
+        gray = cv2.UMat(np.ascontiguousarray(gray))
+    
+    # Применяем бинаризацию (на CPU — в буфер потока)
+    if isinstance(gray, cv2.UMat):
+        binary = cv2.LUT(gray, _BIN_INV_LUT)
+    else:
+        binary = cv2.LUT(gray, _BIN_INV_LUT, dst=_thread_buffer('binary', gray.shape))
+    
+    # Для ответа «есть ли таблица» полное разрешение не нужно: уменьшаем
+    # изображение до _DETECT_MAX_SIDE по длинной стороне. Уменьшаем уже
+    # бинарное изображение, иначе тонкие светлые линии таблицы пропадут.
+    # Линия толщиной в пиксель после INTER_AREA дает яркость около 255 * scale,
+    # а если попадает на границу двух строк — вдвое меньше, поэтому порог
+    # зависит от масштаба (не выше 64, то есть четверти покрытия, и не ниже 8).
+    # Размер задаем явно: у cv2.UMat нет атрибута shape
+    scale = _DETECT_MAX_SIDE / max(height, width)
+    if scale < 1.0:
+        width, height = max(1, round(width * scale)), max(1, round(height * scale))
+        binary = cv2.resize(binary, (width, height), interpolation=cv2.INTER_AREA)
+        line_threshold = min(64, max(8, int(255 * scale / 2)))
+        _, binary = cv2.threshold(binary, line_threshold, 255, cv2.THRESH_BINARY, dst=binary)
+    
+    # Находим горизонтальные и вертикальные линии
+    # Настраиваем размеры структурных элементов
+    horizontal_size = max(1, width // 30)
+    vertical_size = max(1, height // 30)
+    
+    # Создаем структурные элементы
+    h_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (horizontal_size, 1))
+    v_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, vertical_size))
+    
+    # Выделяем горизонтальные и вертикальные линии (открытие — эрозия
+    # и дилатация за один вызов, без промежуточного изображения)
+    horizontal = cv2.morphologyEx(binary, cv2.MORPH_OPEN, h_kernel)
+    vertical = cv2.morphologyEx(binary, cv2.MORPH_OPEN, v_kernel)
+    
+    # Проекции линий: суммы по строкам для горизонтальных и по столбцам
+    # для вертикальных. Из них за O(W + H) получаем и суммарную длину
+    # линий, и число различных линий
+    row_sum = cv2.reduce(horizontal, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S)
+    col_sum = cv2.reduce(vertical, 0, cv2.REDUCE_SUM, dtype=cv2.CV_32S)
+    
+    # С устройства копируем только проекции (W + H значений), а не изображение
+    if isinstance(row_sum, cv2.UMat):
+        row_sum, col_sum = row_sum.get(), col_sum.get()
+    row_sum, col_sum = row_sum.ravel(), col_sum.ravel()
+    
+    # Считаем таблицей изображение, в котором не меньше двух горизонтальных
+    # и двух вертикальных линий, а их суммарная длина больше половины
+    # ширины и половины высоты соответственно
+    h_lines = _count_runs(row_sum > 0)
+    v_lines = _count_runs(col_sum > 0)
+    return (h_lines >= 2 and v_lines >= 2 and
+            int(row_sum.sum()) // 255 > width // 2 and
+            int(col_sum.sum()) // 255 > height // 2)
+
+
+def detect_table(image: Union[np.ndarray, bytes]) -> bool:
+    """
+    Определяет, содержит ли изображение таблицу.
+    
+    Args:
+        image (Union[np.ndarray, bytes]): Изображение для анализа.
         
-        # Если найдено достаточное количество линий и пересечений, считаем, что это таблица
-        return len(contours) > 5
+    Returns:
+        bool: True, если найдена таблица, иначе False.
+    """
+    try:
+        return _has_table_lines(_to_gray(image, reduced=True))
         
     except Exception as e:
         print(f"Ошибка при обнаружении таблицы: {e}")
         return False
+
+
+def detect_and_ocr(image: Union[np.ndarray, bytes], use_cache: bool = True) -> Optional[str]:
+    """
+    Проверяет изображение на наличие таблицы и, если она найдена, распознает ее текст.
+    
+    Равносильно detect_table с последующим ocr_table, но декодирование
+    и перевод в оттенки серого выполняются один раз, а бинаризация для OCR —
+    только для изображений, на которых найдена таблица.
+    
+    Args:
+        image (Union[np.ndarray, bytes]): Изображение для анализа.
+        use_cache (bool): Использовать кэш результатов OCR.
+        
+    Returns:
+        Optional[str]: Текст таблицы (пустая строка, если распознать его
+            не удалось) или None, если изображение не похоже на таблицу.
+    """
+    try:
+        gray = _to_gray(image)
+        if not _has_table_lines(gray):
+            return None
+        
+    except Exception as e:
+        print(f"Ошибка при обнаружении таблицы: {e}")
+        return None
+    
+    try:
+        return _recognize(_binarize_for_ocr(gray), use_cache)
+        
+    except Exception as e:
+        print(f"Ошибка при OCR таблицы: {e}")
+        return ""